@@ -6,41 +6,68 @@ to remote logging services including Graylog, Google Cloud Logging, AWS CloudWat
 Azure Monitor Logs, IBM Cloud Logs, and Oracle Cloud Infrastructure Logging.
 """
 
-# Dynamic version detection
+# Version is written to _version.py by setuptools-scm at build time
 try:
-    from importlib.metadata import PackageNotFoundError, version
-
-    __version__ = version("flask_remote_logging")
+    from ._version import __version__
 except ImportError:
-    # Python < 3.8
-    try:
-        from importlib_metadata import PackageNotFoundError, version  # type: ignore
-
-        __version__ = version("flask_remote_logging")
-    except ImportError:
-        __version__ = "0.0.1-dev"
-except (PackageNotFoundError, Exception):  # pylint: disable=broad-exception-caught
-    # Fallback for development mode or package not installed
+    # Fallback for a source checkout that has not been built or installed
     __version__ = "0.0.1-dev"
 
-from .aws_extension import AWSLogExtension
-from .azure_extension import AzureLogExtension
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from .compat import get_flask_env, set_flask_env
 from .context_filter import FlaskRemoteLoggingContextFilter
 
-# Import main classes for easy access
-from .extension import GraylogExtension
-from .gcp_extension import GCPLogExtension
-from .ibm_extension import IBMLogExtension
-from .oci_extension import OCILogExtension
-
-# Create aliases for easier imports
-Graylog = GraylogExtension
-GCPLog = GCPLogExtension
-AWSLog = AWSLogExtension
-AzureLog = AzureLogExtension
-IBMLog = IBMLogExtension
-OCILog = OCILogExtension
+if TYPE_CHECKING:
+    from .aws_extension import AWSLogExtension
+    from .azure_extension import AzureLogExtension
+    from .extension import GraylogExtension
+    from .gcp_extension import GCPLogExtension
+    from .ibm_extension import IBMLogExtension
+    from .oci_extension import OCILogExtension
+
+    Graylog = GraylogExtension
+    GCPLog = GCPLogExtension
+    AWSLog = AWSLogExtension
+    AzureLog = AzureLogExtension
+    IBMLog = IBMLogExtension
+    OCILog = OCILogExtension
+
+# Extension classes are imported lazily (PEP 562) so that applications only pay
+# for the backend SDKs they actually use. Maps public name -> (submodule, attribute).
+_LAZY_ATTRIBUTES = {
+    "GraylogExtension": (".extension", "GraylogExtension"),
+    "GCPLogExtension": (".gcp_extension", "GCPLogExtension"),
+    "AWSLogExtension": (".aws_extension", "AWSLogExtension"),
+    "AzureLogExtension": (".azure_extension", "AzureLogExtension"),
+    "IBMLogExtension": (".ibm_extension", "IBMLogExtension"),
+    "OCILogExtension": (".oci_extension", "OCILogExtension"),
+    # Aliases for easier imports
+    "Graylog": (".extension", "GraylogExtension"),
+    "GCPLog": (".gcp_extension", "GCPLogExtension"),
+    "AWSLog": (".aws_extension", "AWSLogExtension"),
+    "AzureLog": (".azure_extension", "AzureLogExtension"),
+    "IBMLog": (".ibm_extension", "IBMLogExtension"),
+    "OCILog": (".oci_extension", "OCILogExtension"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import extension classes on first access and cache them on the package."""
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     "GraylogExtension",
@@ -6,22 +6,176 @@ to AWS CloudWatch Logs. It integrates with the flask-network-logging package to
 provide comprehensive logging capabilities for AWS environments.
 """
 
+import json
 import logging
 import os
-from typing import Any, Callable, Dict, List, Optional
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, List, Mapping, NamedTuple, Optional, Set, Tuple
 
 try:
-    import boto3
-    from botocore.exceptions import ClientError, NoCredentialsError
+    import orjson
 except ImportError:
-    boto3 = None
-    ClientError = Exception
-    NoCredentialsError = Exception
+    orjson = None
 
 from flask import Flask
 
 from .base_extension import BaseLoggingExtension
 
+# boto3 is imported on first use rather than at module load, since it is by far
+# the most expensive import in the package and most applications never use it.
+_LAZY_BOTO_NAMES = ("boto3", "ClientError", "NoCredentialsError")
+
+# PutLogEvents limits: at most 10,000 events and 1 MiB per batch, where each event
+# counts as its UTF-8 message size plus 26 bytes.
+MAX_BATCH_COUNT = 10000
+MAX_BATCH_BYTES = 1048576
+EVENT_OVERHEAD_BYTES = 26
+
+# A rejected sequence token is retried once before giving up
+MAX_SEND_ATTEMPTS = 2
+
+# Number of buffered events that wakes the flusher before flush_interval elapses
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _load_boto3() -> None:
+    """Import boto3 and the botocore exceptions into the module namespace."""
+    try:
+        import boto3 as _boto3
+        from botocore.exceptions import ClientError as _ClientError
+        from botocore.exceptions import NoCredentialsError as _NoCredentialsError
+    except ImportError:
+        _boto3 = None
+        _ClientError = Exception
+        _NoCredentialsError = Exception
+
+    # setdefault keeps any value already bound (e.g. patched in tests)
+    module_globals = globals()
+    module_globals.setdefault("boto3", _boto3)
+    module_globals.setdefault("ClientError", _ClientError)
+    module_globals.setdefault("NoCredentialsError", _NoCredentialsError)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazily imported boto3 names on first attribute access."""
+    if name in _LAZY_BOTO_NAMES:
+        _load_boto3()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_boto3() -> Any:
+    """Return the boto3 module, or None if it is not installed."""
+    if "boto3" not in globals():
+        _load_boto3()
+    return globals()["boto3"]
+
+
+def _client_error() -> Any:
+    """Return the botocore ClientError class (Exception if boto3 is missing)."""
+    if "ClientError" not in globals():
+        _load_boto3()
+    return globals()["ClientError"]
+
+
+def _credential_errors() -> Any:
+    """Return the botocore exceptions raised while creating a client."""
+    if "NoCredentialsError" not in globals():
+        _load_boto3()
+    return (globals()["NoCredentialsError"], _client_error())
+
+
+def _aws_error_code(error: BaseException) -> Optional[str]:
+    """
+    Extract the AWS error code from a botocore ClientError.
+
+    Args:
+        error: Exception raised by a boto3 client call
+
+    Returns:
+        The error code (e.g. "ResourceAlreadyExistsException"), or None if unavailable
+    """
+    response = getattr(error, "response", None)
+    if not isinstance(response, dict):
+        return None
+    return response.get("Error", {}).get("Code")
+
+
+@lru_cache(maxsize=None)
+def _aws_environment() -> Dict[str, Any]:
+    """
+    Read the AWS_* environment variables once per process.
+
+    Defaults and the boolean parsing of the create flags are applied here, so
+    ``_get_config_from_app`` only has to fall back to these values. Call
+    ``_aws_environment.cache_clear()`` to pick up environment changes.
+
+    Returns:
+        Dictionary of environment-derived AWS settings
+    """
+    return {
+        "AWS_REGION": os.getenv("AWS_REGION", "us-east-1"),
+        "AWS_ACCESS_KEY_ID": os.getenv("AWS_ACCESS_KEY_ID"),
+        "AWS_SECRET_ACCESS_KEY": os.getenv("AWS_SECRET_ACCESS_KEY"),
+        "AWS_LOG_GROUP": os.getenv("AWS_LOG_GROUP"),
+        "AWS_LOG_STREAM": os.getenv("AWS_LOG_STREAM"),
+        "AWS_LOG_LEVEL": os.getenv("AWS_LOG_LEVEL", "INFO"),
+        "AWS_ENVIRONMENT": os.getenv("AWS_ENVIRONMENT", "development"),
+        "AWS_CREATE_LOG_GROUP": os.getenv("AWS_CREATE_LOG_GROUP", "true").lower() == "true",
+        "AWS_CREATE_LOG_STREAM": os.getenv("AWS_CREATE_LOG_STREAM", "true").lower() == "true",
+        "AWS_LOG_PROPAGATE": os.getenv("AWS_LOG_PROPAGATE", "false").lower() == "true",
+    }
+
+
+class AWSConfig(NamedTuple):
+    """
+    Resolved, immutable AWS CloudWatch settings.
+
+    Built once from the extension's config dictionary during ``init_app`` so the
+    setup code reads plain attributes instead of repeating dictionary lookups.
+    """
+
+    region: str = "us-east-1"
+    access_key_id: Optional[str] = None
+    secret_access_key: Optional[str] = None
+    log_group: Optional[str] = None
+    log_stream: Optional[str] = None
+    environment: str = "development"
+    target_environment: str = "development"
+    create_log_group: bool = True
+    create_log_stream: bool = True
+    propagate: bool = False
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "AWSConfig":
+        """
+        Build the settings from an extension config dictionary.
+
+        Args:
+            config: Dictionary returned by ``AWSLogExtension._get_config_from_app``
+
+        Returns:
+            AWSConfig with defaults applied for missing keys
+        """
+        return cls(
+            region=config.get("AWS_REGION", "us-east-1"),
+            access_key_id=config.get("AWS_ACCESS_KEY_ID"),
+            secret_access_key=config.get("AWS_SECRET_ACCESS_KEY"),
+            log_group=config.get("AWS_LOG_GROUP"),
+            log_stream=config.get("AWS_LOG_STREAM"),
+            environment=config.get("AWS_ENVIRONMENT", "development"),
+            target_environment=config.get("FLASK_REMOTE_LOGGING_ENVIRONMENT", "development"),
+            create_log_group=config.get("AWS_CREATE_LOG_GROUP", True),
+            create_log_stream=config.get("AWS_CREATE_LOG_STREAM", True),
+            propagate=config.get("AWS_LOG_PROPAGATE", False),
+        )
+
 
 class AWSLogExtension(BaseLoggingExtension):
     """
@@ -83,10 +237,17 @@ class AWSLogExtension(BaseLoggingExtension):
             enable_middleware: Whether to enable request/response middleware (default: True)
         """
         # AWS-specific attributes
-        self.cloudwatch_client = None
+        self._log_formatter_provided = log_formatter is not None
+        self.aws_config = AWSConfig()
+        self._cloudwatch_client: Any = None
+        self._cloudwatch_client_pending = False
         self.log_group = None
         self.log_stream = None
 
+        # Log groups/streams already known to exist, so repeated setup skips the API round trips
+        self._ensured_log_groups: Set[str] = set()
+        self._ensured_log_streams: Set[Tuple[str, str]] = set()
+
         # Call parent constructor
         super().__init__(
             app=app,
@@ -114,59 +275,90 @@ class AWSLogExtension(BaseLoggingExtension):
         if not self.app:
             return {}
 
+        config = self.app.config
+        env = _aws_environment()
+
         return {
-            "AWS_REGION": self.app.config.get("AWS_REGION", os.getenv("AWS_REGION", "us-east-1")),
-            "AWS_ACCESS_KEY_ID": self.app.config.get("AWS_ACCESS_KEY_ID", os.getenv("AWS_ACCESS_KEY_ID")),
-            "AWS_SECRET_ACCESS_KEY": self.app.config.get("AWS_SECRET_ACCESS_KEY", os.getenv("AWS_SECRET_ACCESS_KEY")),
-            "AWS_LOG_GROUP": self.app.config.get("AWS_LOG_GROUP", os.getenv("AWS_LOG_GROUP")),
-            "AWS_LOG_STREAM": self.app.config.get("AWS_LOG_STREAM", os.getenv("AWS_LOG_STREAM")),
-            "AWS_LOG_LEVEL": self.app.config.get("AWS_LOG_LEVEL", os.getenv("AWS_LOG_LEVEL", "INFO")),
-            "AWS_ENVIRONMENT": self.app.config.get("AWS_ENVIRONMENT", os.getenv("AWS_ENVIRONMENT", "development")),
-            "FLASK_REMOTE_LOGGING_ENVIRONMENT": self.app.config.get(
+            "AWS_REGION": config.get("AWS_REGION", env["AWS_REGION"]),
+            "AWS_ACCESS_KEY_ID": config.get("AWS_ACCESS_KEY_ID", env["AWS_ACCESS_KEY_ID"]),
+            "AWS_SECRET_ACCESS_KEY": config.get("AWS_SECRET_ACCESS_KEY", env["AWS_SECRET_ACCESS_KEY"]),
+            "AWS_LOG_GROUP": config.get("AWS_LOG_GROUP", env["AWS_LOG_GROUP"]),
+            "AWS_LOG_STREAM": config.get("AWS_LOG_STREAM", env["AWS_LOG_STREAM"]),
+            "AWS_LOG_LEVEL": config.get("AWS_LOG_LEVEL", env["AWS_LOG_LEVEL"]),
+            "AWS_ENVIRONMENT": config.get("AWS_ENVIRONMENT", env["AWS_ENVIRONMENT"]),
+            "FLASK_REMOTE_LOGGING_ENVIRONMENT": config.get(
                 "FLASK_REMOTE_LOGGING_ENVIRONMENT",
-                self.app.config.get(
-                    "AWS_ENVIRONMENT", os.getenv("AWS_ENVIRONMENT", "development")
-                ),  # Backward compatibility
-            ),
-            "AWS_CREATE_LOG_GROUP": self.app.config.get(
-                "AWS_CREATE_LOG_GROUP", os.getenv("AWS_CREATE_LOG_GROUP", "true").lower() == "true"
-            ),
-            "AWS_CREATE_LOG_STREAM": self.app.config.get(
-                "AWS_CREATE_LOG_STREAM", os.getenv("AWS_CREATE_LOG_STREAM", "true").lower() == "true"
-            ),
-            "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE": self.app.config.get(
-                "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE", None
+                config.get("AWS_ENVIRONMENT", env["AWS_ENVIRONMENT"]),  # Backward compatibility
             ),
+            "AWS_CREATE_LOG_GROUP": config.get("AWS_CREATE_LOG_GROUP", env["AWS_CREATE_LOG_GROUP"]),
+            "AWS_CREATE_LOG_STREAM": config.get("AWS_CREATE_LOG_STREAM", env["AWS_CREATE_LOG_STREAM"]),
+            "AWS_LOG_PROPAGATE": config.get("AWS_LOG_PROPAGATE", env["AWS_LOG_PROPAGATE"]),
+            "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE": config.get("FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE", None),
         }
 
     def _init_backend(self) -> None:
         """Initialize the AWS CloudWatch backend."""
-        # Initialize AWS CloudWatch client if boto3 is available
-        if boto3:
-            try:
-                self._init_cloudwatch_client()
-            except Exception as e:
-                if self.app:
-                    self.app.logger.warning(f"Failed to initialize AWS CloudWatch client: {e}")
+        self.aws_config = AWSConfig.from_config(self.config)
+
+        # Set log group and stream names
+        self.log_group = self.aws_config.log_group
+        self.log_stream = self.aws_config.log_stream
+
+        # The boto3 client is created on first use (see cloudwatch_client), since building
+        # it loads botocore service models and resolves credentials.
+        self._cloudwatch_client = None
+        self._cloudwatch_client_pending = True
+
+    @property
+    def cloudwatch_client(self) -> Any:
+        """
+        The boto3 CloudWatch Logs client, created on first access.
+
+        Returns:
+            The client, or None if boto3 is unavailable or the client could not be created
+        """
+        if self._cloudwatch_client is None and self._cloudwatch_client_pending:
+            self._cloudwatch_client_pending = False
+            # Only create the client if boto3 is available
+            if _get_boto3():
+                try:
+                    self._init_cloudwatch_client()
+                except Exception as e:
+                    if self.app:
+                        self.app.logger.warning(f"Failed to initialize AWS CloudWatch client: {e}")
+        return self._cloudwatch_client
+
+    @cloudwatch_client.setter
+    def cloudwatch_client(self, client: Any) -> None:
+        self._cloudwatch_client = client
+        self._cloudwatch_client_pending = False
+
+    def _can_create_cloudwatch_client(self) -> bool:
+        """Return True if a client exists or can be created without building it yet."""
+        if self._cloudwatch_client is not None:
+            return True
+        return self._cloudwatch_client_pending and _get_boto3() is not None
 
     def _create_log_handler(self) -> Optional[logging.Handler]:
         """Create the appropriate log handler for AWS CloudWatch."""
         # Only set up CloudWatch logging in AWS environments or when explicitly configured
-        environment = self.config.get("FLASK_REMOTE_LOGGING_ENVIRONMENT", "development")
+        aws_config = self.aws_config
 
-        if environment in ["aws", "production"] or self.config.get("AWS_LOG_GROUP"):
-            if self.cloudwatch_client and self.log_group:
+        if aws_config.target_environment in ["aws", "production"] or aws_config.log_group:
+            if self.log_group and self._can_create_cloudwatch_client():
                 # Ensure log group and stream exist
-                if self.config.get("AWS_CREATE_LOG_GROUP", True):
+                if aws_config.create_log_group:
                     self._ensure_log_group_exists()
-                if self.config.get("AWS_CREATE_LOG_STREAM", True) and self.log_stream:
+                if aws_config.create_log_stream and self.log_stream:
                     self._ensure_log_stream_exists()
 
                 # Create a simple CloudWatch handler (placeholder)
                 handler = logging.StreamHandler()
-                handler.setFormatter(
-                    self.log_formatter or logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-                )
+                if self._log_formatter_provided and self.log_formatter:
+                    handler.setFormatter(self.log_formatter)
+                else:
+                    # Structured JSON lines are cheaper to build and are parsed natively by Logs Insights
+                    handler.setFormatter(CloudWatchJsonFormatter(environment=aws_config.environment))
                 return handler
             else:
                 # Fallback to stream handler if CloudWatch not properly configured
@@ -183,9 +375,19 @@ class AWSLogExtension(BaseLoggingExtension):
         - Environment is 'aws' or 'production', OR
         - AWS_LOG_GROUP is explicitly configured
         """
+        # Called before _init_backend resolves aws_config, so read the config dict directly
         environment = self.config.get("FLASK_REMOTE_LOGGING_ENVIRONMENT", "development")
         return environment not in ["aws", "production"] and not self.config.get("AWS_LOG_GROUP")
 
+    def _should_propagate(self) -> bool:
+        """
+        Determine whether configured loggers should propagate to their parents.
+
+        Disabled by default (``AWS_LOG_PROPAGATE``) so records are not formatted and
+        emitted a second time by root handlers, e.g. under Gunicorn.
+        """
+        return bool(self.aws_config.propagate)
+
     def _get_extension_name(self) -> str:
         """Get the display name of the extension."""
         return "AWS CloudWatch Logs"
@@ -198,69 +400,128 @@ class AWSLogExtension(BaseLoggingExtension):
 
     def _init_cloudwatch_client(self):
         """Initialize the AWS CloudWatch Logs client."""
+        boto3 = _get_boto3()
         if not boto3:
             raise ImportError(
                 "boto3 is required for AWS CloudWatch Logs support. "
-                "Install it with: pip install flask-network-logging[aws]"
+                "Install it with: pip install flask-remote-logging[aws]"
             )
 
         try:
-            # Create CloudWatch Logs client
-            session_kwargs = {"region_name": self.config.get("AWS_REGION", "us-east-1")}
+            # Create CloudWatch Logs client from boto3's default session
+            aws_config = self.aws_config
+            client_kwargs = {"region_name": aws_config.region}
 
             # Add credentials if provided
-            aws_access_key = self.config.get("AWS_ACCESS_KEY_ID")
-            aws_secret_key = self.config.get("AWS_SECRET_ACCESS_KEY")
+            aws_access_key = aws_config.access_key_id
+            aws_secret_key = aws_config.secret_access_key
 
             if aws_access_key and aws_secret_key:
-                session_kwargs["aws_access_key_id"] = aws_access_key
-                session_kwargs["aws_secret_access_key"] = aws_secret_key
+                client_kwargs["aws_access_key_id"] = aws_access_key
+                client_kwargs["aws_secret_access_key"] = aws_secret_key
 
-            session = boto3.Session(**session_kwargs)
-            self.cloudwatch_client = session.client("logs")
+            self._cloudwatch_client = boto3.client("logs", **client_kwargs)
 
-            # Set log group and stream names
-            self.log_group = self.config.get("AWS_LOG_GROUP")
-            self.log_stream = self.config.get("AWS_LOG_STREAM")
-
-        except (NoCredentialsError, ClientError) as e:
+        except _credential_errors() as e:
             if self.app:
                 self.app.logger.warning(f"AWS CloudWatch Logs initialization failed: {e}")
-            self.cloudwatch_client = None
+            self._cloudwatch_client = None
 
     def _ensure_log_group_exists(self):
         """Ensure the CloudWatch log group exists, create if it doesn't."""
         if not self.cloudwatch_client or not self.log_group:
             return
+        if self.log_group in self._ensured_log_groups:
+            return
 
+        # Create unconditionally and treat "already exists" as success: one API call either way
         try:
-            self.cloudwatch_client.describe_log_groups(logGroupNamePrefix=self.log_group)
-        except ClientError:
-            try:
-                self.cloudwatch_client.create_log_group(logGroupName=self.log_group)
-                if self.app:
-                    self.app.logger.info(f"Created CloudWatch log group: {self.log_group}")
-            except ClientError as e:
+            self.cloudwatch_client.create_log_group(logGroupName=self.log_group)
+            if self.app:
+                self.app.logger.info(f"Created CloudWatch log group: {self.log_group}")
+        except _client_error() as e:
+            if _aws_error_code(e) != "ResourceAlreadyExistsException":
                 if self.app:
                     self.app.logger.warning(f"Failed to create log group {self.log_group}: {e}")
+                return
+
+        self._ensured_log_groups.add(self.log_group)
 
     def _ensure_log_stream_exists(self):
         """Ensure the CloudWatch log stream exists, create if it doesn't."""
         if not self.cloudwatch_client or not self.log_group or not self.log_stream:
             return
+        if (self.log_group, self.log_stream) in self._ensured_log_streams:
+            return
 
+        # Create unconditionally and treat "already exists" as success: one API call either way
         try:
-            self.cloudwatch_client.describe_log_streams(
-                logGroupName=self.log_group, logStreamNamePrefix=self.log_stream
-            )
-        except ClientError:
-            try:
-                self.cloudwatch_client.create_log_stream(logGroupName=self.log_group, logStreamName=self.log_stream)
-                if self.app:
-                    self.app.logger.info(f"Created CloudWatch log stream: {self.log_stream}")
-            except ClientError as e:
+            self.cloudwatch_client.create_log_stream(logGroupName=self.log_group, logStreamName=self.log_stream)
+            if self.app:
+                self.app.logger.info(f"Created CloudWatch log stream: {self.log_stream}")
+        except _client_error() as e:
+            if _aws_error_code(e) != "ResourceAlreadyExistsException":
                 if self.app:
                     self.app.logger.warning(f"Failed to create log stream {self.log_stream}: {e}")
+                return
+
+        self._ensured_log_streams.add((self.log_group, self.log_stream))
+
+
+class CloudWatchJsonFormatter(logging.Formatter):
+    """
+    Log formatter that renders each record as a single JSON line for CloudWatch Logs.
+
+    The output is a small, flat JSON object that CloudWatch Logs Insights can query
+    directly. Uses orjson when it is installed and falls back to the standard library.
+    """
+
+    def __init__(self, environment: Optional[str] = None):
+        """
+        Initialize the JSON formatter.
+
+        Args:
+            environment: Optional environment name included in every entry
+        """
+        super().__init__()
+        self.environment = environment
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a log record as a JSON string.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            JSON representation of the record
+        """
+        entry: Dict[str, Any] = {
+            "timestamp": int(record.created * 1000),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if self.environment:
+            entry["environment"] = self.environment
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        if orjson is not None:
+            return orjson.dumps(entry).decode("utf-8")
+        return json.dumps(entry)
+
+
+def _reset_handler_after_fork(handler_ref: "weakref.ReferenceType[CloudWatchHandler]") -> None:
+    """
+    Reset a handler's flush state in a freshly forked child process.
+
+    Args:
+        handler_ref: Weak reference to the handler, so registration does not keep it alive
+    """
+    handler = handler_ref()
+    if handler is not None:
+        handler._reset_after_fork()
 
 
 class CloudWatchHandler(logging.Handler):
@@ -268,27 +529,73 @@ class CloudWatchHandler(logging.Handler):
     Custom logging handler for AWS CloudWatch Logs.
 
     This handler sends log records to AWS CloudWatch Logs using the boto3 client.
-    It handles batching and error recovery for reliable log delivery.
+    Records are buffered in memory and shipped in batches by a background thread,
+    so that a single PutLogEvents call covers many records.
     """
 
-    def __init__(self, client, log_group: str, log_stream: str):
+    def __init__(
+        self,
+        client,
+        log_group: str,
+        log_stream: str,
+        flush_interval: float = 1.0,
+        max_buffer_size: int = MAX_BATCH_COUNT,
+        client_factory: Optional[Callable[[], Any]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
         """
         Initialize the CloudWatch handler.
 
         Args:
-            client: boto3 CloudWatch Logs client
+            client: boto3 CloudWatch Logs client (may be None if client_factory is given)
             log_group: CloudWatch log group name
             log_stream: CloudWatch log stream name
+            flush_interval: Seconds between background flushes of the buffer
+            max_buffer_size: Maximum number of buffered events (oldest are dropped when full)
+            client_factory: Callable returning the client, invoked on the first send
+            batch_size: Number of buffered events that triggers an early flush
         """
         super().__init__()
-        self.client = client
+        self._client = client
+        self._client_factory = client_factory
         self.log_group = log_group
         self.log_stream = log_stream
         self.sequence_token = None
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        self._buffer: Deque[Dict[str, Any]] = deque(maxlen=max_buffer_size)
+        # A full buffer must wake the flusher even when it holds less than a batch
+        self._flush_threshold = min(batch_size, max_buffer_size)
+        self._dropped = 0
+        self._buffer_ready = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._shutdown = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+        # Pre-fork servers (gunicorn --preload, uWSGI) copy the handler into each worker
+        # without its flush thread; give every worker its own flusher and an empty buffer
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=lambda ref=weakref.ref(self): _reset_handler_after_fork(ref))
+
+    def _reset_after_fork(self) -> None:
+        """Drop the parent's flush thread, locks and buffered events after a fork."""
+        self._buffer.clear()  # the parent process still sends these
+        self._dropped = 0
+        self._buffer_ready = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._flush_thread = None
+
+    @property
+    def client(self) -> Any:
+        """The boto3 CloudWatch Logs client, resolved from client_factory on first use."""
+        if self._client is None and self._client_factory is not None:
+            self._client = self._client_factory()
+        return self._client
 
     def emit(self, record: logging.LogRecord):
         """
-        Emit a log record to CloudWatch Logs.
+        Buffer a log record for delivery to CloudWatch Logs.
 
         Args:
             record: Log record to emit
@@ -300,45 +607,128 @@ class CloudWatchHandler(logging.Handler):
             # Prepare log event
             log_event = {"timestamp": int(record.created * 1000), "message": message}  # CloudWatch expects milliseconds
 
-            # Send to CloudWatch
-            self._send_log_event(log_event)
+            with self._buffer_ready:
+                if len(self._buffer) == self._buffer.maxlen:
+                    self._dropped += 1  # the append below evicts the oldest event
+                self._buffer.append(log_event)
+                if self._flush_thread is None:
+                    self._start_flush_thread()
+                elif len(self._buffer) >= self._flush_threshold:
+                    self._buffer_ready.notify()
 
         except Exception:
             # Don't let logging errors break the application
             self.handleError(record)
 
-    def _send_log_event(self, log_event: Dict[str, Any]):
+    def flush(self):
+        """Send all buffered log events to CloudWatch Logs."""
+        with self._send_lock:
+            while True:
+                batch = self._take_batch()
+                if not batch:
+                    return
+                try:
+                    self._send_log_events(batch)
+                except Exception:
+                    # Don't let logging errors break the application
+                    if logging.raiseExceptions:
+                        traceback.print_exc(file=sys.stderr)
+
+    def _dropped_notice(self, dropped: int) -> Dict[str, Any]:
         """
-        Send a single log event to CloudWatch Logs.
+        Build a log event reporting events discarded because the buffer was full.
 
         Args:
-            log_event: Log event dictionary
+            dropped: Number of discarded log events
+
+        Returns:
+            A log event in the same shape as those built by emit
         """
-        try:
-            kwargs = {"logGroupName": self.log_group, "logStreamName": self.log_stream, "logEvents": [log_event]}
+        return {
+            "timestamp": time.time_ns() // 1_000_000,
+            "message": f"CloudWatchHandler dropped {dropped} log events because its buffer was full",
+        }
+
+    def close(self):
+        """Stop the background flusher and send any remaining log events."""
+        self._shutdown.set()
+        with self._buffer_ready:
+            self._buffer_ready.notify()
+        if self._flush_thread is not None and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=self.flush_interval)
+        self.flush()
+        super().close()
+
+    def _start_flush_thread(self):
+        """Start the background thread that periodically flushes the buffer."""
+        self._flush_thread = threading.Thread(target=self._flush_loop, name="CloudWatchHandlerFlush", daemon=True)
+        self._flush_thread.start()
+
+    def _flush_loop(self):
+        """Flush every ``flush_interval`` seconds, or sooner once ``batch_size`` events are buffered."""
+        while not self._shutdown.is_set():
+            with self._buffer_ready:
+                self._buffer_ready.wait_for(
+                    lambda: self._shutdown.is_set() or len(self._buffer) >= self._flush_threshold,
+                    timeout=self.flush_interval,
+                )
+            self.flush()
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        """
+        Pop the next batch of events from the buffer within the PutLogEvents limits.
+
+        Returns:
+            List of log events sorted by timestamp (empty if the buffer is empty)
+        """
+        batch: List[Dict[str, Any]] = []
+        batch_bytes = 0
+        with self._buffer_ready:
+            dropped, self._dropped = self._dropped, 0
+            if dropped:
+                # Report evicted events in the next batch, counted against its limits
+                notice = self._dropped_notice(dropped)
+                batch.append(notice)
+                batch_bytes += len(notice["message"]) + EVENT_OVERHEAD_BYTES
+            while self._buffer and len(batch) < MAX_BATCH_COUNT:
+                event = self._buffer[0]
+                event_bytes = len(event["message"].encode("utf-8")) + EVENT_OVERHEAD_BYTES
+                if batch and batch_bytes + event_bytes > MAX_BATCH_BYTES:
+                    break
+                batch.append(self._buffer.popleft())
+                batch_bytes += event_bytes
+
+        # CloudWatch requires events in a batch to be in chronological order
+        batch.sort(key=lambda event: event["timestamp"])
+        return batch
+
+    def _send_log_events(self, log_events: List[Dict[str, Any]]):
+        """
+        Send a batch of log events to CloudWatch Logs.
+
+        If CloudWatch rejects the sequence token, the token is reset and the batch
+        is retried once; any other error is raised to the caller.
+
+        Args:
+            log_events: Log event dictionaries, sorted by timestamp
+        """
+        for attempt in range(MAX_SEND_ATTEMPTS):
+            kwargs = {"logGroupName": self.log_group, "logStreamName": self.log_stream, "logEvents": log_events}
 
             # Include sequence token if we have one
             if self.sequence_token:
                 kwargs["sequenceToken"] = self.sequence_token
 
-            response = self.client.put_log_events(**kwargs)
+            try:
+                response = self.client.put_log_events(**kwargs)
+            except Exception as e:
+                # Handle both ClientError and general exceptions
+                if _aws_error_code(e) != "InvalidSequenceTokenException" or attempt == MAX_SEND_ATTEMPTS - 1:
+                    raise
+                # Reset sequence token and retry
+                self.sequence_token = None
+                continue
 
             # Update sequence token for next request
             self.sequence_token = response.get("nextSequenceToken")
-
-        except Exception as e:
-            # Handle both ClientError and general exceptions
-            if hasattr(e, "response"):
-                response = getattr(e, "response", {})
-                if "Error" in response:
-                    error_code = response.get("Error", {}).get("Code")
-                    if error_code == "InvalidSequenceTokenException":
-                        # Reset sequence token and retry
-                        self.sequence_token = None
-                        self._send_log_event(log_event)
-                    else:
-                        raise
-                else:
-                    raise
-            else:
-                raise
+            return
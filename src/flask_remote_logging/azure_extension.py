@@ -7,23 +7,215 @@ package to provide comprehensive logging capabilities for Azure environments.
 """
 
 import base64
-import hashlib
+import gzip
 import hmac
 import json
 import logging
 import os
-from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from email.utils import formatdate
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional
 
 try:
-    import requests
+    import orjson
 except ImportError:
-    requests = None
+    orjson = None
 
 from flask import Flask
 
 from .base_extension import BaseLoggingExtension
 
+# requests (and urllib3) are imported on first use rather than at module load,
+# so applications that never configure Azure do not pay for them at startup.
+_LAZY_REQUESTS_NAMES = ("requests",)
+
+# Default batching settings for AzureMonitorHandler
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_BUFFER_SIZE = 10000
+# The HTTP Data Collector API rejects posts over 30 MB; stay well below that
+MAX_BATCH_BYTES = 25 * 1024 * 1024
+# Payloads smaller than this are not worth gzip-compressing
+COMPRESS_MIN_BYTES = 1024
+# Transient statuses retried by the session's transport adapter
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+# LogRecord attributes that are already mapped to fields or are not useful to ship
+_LOGRECORD_STANDARD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "taskName",
+        "getMessage",
+        "stack_info",
+        "exc_info",
+        "exc_text",
+        "message",
+        "asctime",
+    }
+)
+
+# Range of integers orjson encodes natively; anything wider is shipped as a string
+_INT_MIN = -(2**63)
+_INT_MAX = 2**64 - 1
+
+
+def _load_requests() -> None:
+    """Import requests into the module namespace."""
+    try:
+        import requests as _requests
+    except ImportError:
+        _requests = None
+
+    # setdefault keeps any value already bound (e.g. patched in tests)
+    globals().setdefault("requests", _requests)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazily imported requests module on first attribute access."""
+    if name in _LAZY_REQUESTS_NAMES:
+        _load_requests()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_requests() -> Any:
+    """Return the requests module, or None if it is not installed."""
+    if "requests" not in globals():
+        _load_requests()
+    return globals()["requests"]
+
+
+@lru_cache(maxsize=None)
+def _azure_environment() -> Dict[str, Any]:
+    """
+    Read the AZURE_* environment variables once per process.
+
+    Call ``_azure_environment.cache_clear()`` to pick up environment changes.
+
+    Returns:
+        Dictionary of environment-derived Azure settings
+    """
+    return {
+        "AZURE_WORKSPACE_ID": os.getenv("AZURE_WORKSPACE_ID"),
+        "AZURE_WORKSPACE_KEY": os.getenv("AZURE_WORKSPACE_KEY"),
+        "AZURE_LOG_TYPE": os.getenv("AZURE_LOG_TYPE", "FlaskAppLogs"),
+        "AZURE_LOG_LEVEL": os.getenv("AZURE_LOG_LEVEL", "INFO"),
+        "AZURE_ENVIRONMENT": os.getenv("AZURE_ENVIRONMENT", "development"),
+        "AZURE_TIMEOUT": os.getenv("AZURE_TIMEOUT", "30"),
+        "AZURE_BATCH_SIZE": os.getenv("AZURE_BATCH_SIZE", str(DEFAULT_BATCH_SIZE)),
+        "AZURE_FLUSH_INTERVAL": os.getenv("AZURE_FLUSH_INTERVAL", str(DEFAULT_FLUSH_INTERVAL)),
+        "AZURE_COMPRESS": os.getenv("AZURE_COMPRESS", "false").lower() == "true",
+    }
+
+
+def _format_timestamp(created: float) -> str:
+    """
+    Format a LogRecord creation time as an ISO 8601 UTC timestamp.
+
+    Args:
+        created: Seconds since the epoch, as in ``LogRecord.created``
+
+    Returns:
+        Timestamp such as ``2024-01-31T12:00:00.123456Z``
+    """
+    g = time.gmtime(created)
+    return (
+        f"{g.tm_year:04d}-{g.tm_mon:02d}-{g.tm_mday:02d}T{g.tm_hour:02d}:{g.tm_min:02d}:{g.tm_sec:02d}"
+        f".{int(created % 1 * 1e6):06d}Z"
+    )
+
+
+def _extra_value(value: Any) -> Any:
+    """
+    Snapshot an extra field value as something both JSON encoders accept.
+
+    Args:
+        value: Value of an extra attribute on a log record
+
+    Returns:
+        ``value`` for strings, floats, booleans, None and 64-bit integers, otherwise ``str(value)``
+    """
+    if value is None or isinstance(value, str) or type(value) is float:
+        return value
+    if isinstance(value, int) and _INT_MIN <= value <= _INT_MAX:
+        return value
+    return str(value)
+
+
+class _AzureRecord(NamedTuple):
+    """
+    The fields of a log record captured by ``AzureMonitorHandler.emit``.
+
+    Building the payload dictionary and formatting the timestamp are deferred to
+    the flush thread, keeping that work off the logging call path.
+    """
+
+    created: float
+    level: str
+    logger: str
+    message: str
+    module: str
+    function: Optional[str]
+    line: int
+    thread: Optional[int]
+    process: Optional[int]
+    extra: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Build the Azure Monitor log entry for this record.
+
+        Returns:
+            Dictionary of standard fields followed by the record's extra fields
+        """
+        entry = {
+            "timestamp": _format_timestamp(self.created),
+            "level": self.level,
+            "logger": self.logger,
+            "message": self.message,
+            "module": self.module,
+            "function": self.function,
+            "line": self.line,
+            "thread": self.thread,
+            "process": self.process,
+        }
+        entry.update(self.extra)
+        return entry
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize ``obj`` to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Values that are not natively JSON serializable are converted with ``str()``.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str).encode("utf-8")
+
 
 class AzureLogExtension(BaseLoggingExtension):
     """
@@ -116,24 +308,23 @@ class AzureLogExtension(BaseLoggingExtension):
         if not self.app:
             return {}
 
+        config = self.app.config
+        env = _azure_environment()
+        environment = config.get("AZURE_ENVIRONMENT", env["AZURE_ENVIRONMENT"])
+
         return {
-            "AZURE_WORKSPACE_ID": self.app.config.get("AZURE_WORKSPACE_ID", os.getenv("AZURE_WORKSPACE_ID")),
-            "AZURE_WORKSPACE_KEY": self.app.config.get("AZURE_WORKSPACE_KEY", os.getenv("AZURE_WORKSPACE_KEY")),
-            "AZURE_LOG_TYPE": self.app.config.get("AZURE_LOG_TYPE", os.getenv("AZURE_LOG_TYPE", "FlaskAppLogs")),
-            "AZURE_LOG_LEVEL": self.app.config.get("AZURE_LOG_LEVEL", os.getenv("AZURE_LOG_LEVEL", "INFO")),
-            "AZURE_ENVIRONMENT": self.app.config.get(
-                "AZURE_ENVIRONMENT", os.getenv("AZURE_ENVIRONMENT", "development")
-            ),
-            "FLASK_REMOTE_LOGGING_ENVIRONMENT": self.app.config.get(
-                "FLASK_REMOTE_LOGGING_ENVIRONMENT",
-                self.app.config.get(
-                    "AZURE_ENVIRONMENT", os.getenv("AZURE_ENVIRONMENT", "development")
-                ),  # Backward compatibility
-            ),
-            "AZURE_TIMEOUT": self.app.config.get("AZURE_TIMEOUT", os.getenv("AZURE_TIMEOUT", "30")),
-            "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE": self.app.config.get(
-                "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE", None
-            ),
+            "AZURE_WORKSPACE_ID": config.get("AZURE_WORKSPACE_ID", env["AZURE_WORKSPACE_ID"]),
+            "AZURE_WORKSPACE_KEY": config.get("AZURE_WORKSPACE_KEY", env["AZURE_WORKSPACE_KEY"]),
+            "AZURE_LOG_TYPE": config.get("AZURE_LOG_TYPE", env["AZURE_LOG_TYPE"]),
+            "AZURE_LOG_LEVEL": config.get("AZURE_LOG_LEVEL", env["AZURE_LOG_LEVEL"]),
+            "AZURE_ENVIRONMENT": environment,
+            # AZURE_ENVIRONMENT is honoured for backward compatibility
+            "FLASK_REMOTE_LOGGING_ENVIRONMENT": config.get("FLASK_REMOTE_LOGGING_ENVIRONMENT", environment),
+            "AZURE_TIMEOUT": config.get("AZURE_TIMEOUT", env["AZURE_TIMEOUT"]),
+            "AZURE_BATCH_SIZE": config.get("AZURE_BATCH_SIZE", env["AZURE_BATCH_SIZE"]),
+            "AZURE_FLUSH_INTERVAL": config.get("AZURE_FLUSH_INTERVAL", env["AZURE_FLUSH_INTERVAL"]),
+            "AZURE_COMPRESS": config.get("AZURE_COMPRESS", env["AZURE_COMPRESS"]),
+            "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE": config.get("FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE", None),
         }
 
     def _init_backend(self) -> None:
@@ -156,6 +347,9 @@ class AzureLogExtension(BaseLoggingExtension):
                     workspace_id=self.workspace_id,
                     workspace_key=self.workspace_key,
                     log_type=self.log_type or "FlaskAppLogs",
+                    batch_size=int(self.config.get("AZURE_BATCH_SIZE", DEFAULT_BATCH_SIZE)),
+                    flush_interval=float(self.config.get("AZURE_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL)),
+                    compress=bool(self.config.get("AZURE_COMPRESS", False)),
                 )
                 return handler
             else:
@@ -188,10 +382,10 @@ class AzureLogExtension(BaseLoggingExtension):
 
     def _init_azure_config(self):
         """Initialize Azure Monitor configuration."""
-        if not requests:
+        if not _get_requests():
             raise ImportError(
                 "requests is required for Azure Monitor Logs support. "
-                "Install it with: pip install flask-network-logging[azure]"
+                "Install it with: pip install flask-remote-logging[azure]"
             )
 
         self.workspace_id = self.config.get("AZURE_WORKSPACE_ID")
@@ -203,15 +397,42 @@ class AzureLogExtension(BaseLoggingExtension):
                 self.app.logger.warning("Azure Monitor Logs: Missing workspace ID or key")
 
 
+def _reset_handler_after_fork(handler_ref: "weakref.ReferenceType[AzureMonitorHandler]") -> None:
+    """
+    Reset a handler's flush state in a freshly forked child process.
+
+    Args:
+        handler_ref: Weak reference to the handler, so registration does not keep it alive
+    """
+    handler = handler_ref()
+    if handler is not None:
+        handler._reset_after_fork()
+
+
 class AzureMonitorHandler(logging.Handler):
     """
     Custom logging handler for Azure Monitor Logs (Azure Log Analytics).
 
     This handler sends log records to Azure Monitor Logs using the HTTP Data Collector API.
-    It handles authentication and error recovery for reliable log delivery.
+    Records are buffered in memory and posted in batches by a background thread, so that
+    a single signed request covers many records.
     """
 
-    def __init__(self, workspace_id: str, workspace_key: str, log_type: str, timeout: int = 30):
+    # HTTP Data Collector API endpoint path and version
+    RESOURCE = "/api/logs"
+    API_VERSION = "2016-04-01"
+
+    def __init__(
+        self,
+        workspace_id: str,
+        workspace_key: str,
+        log_type: str,
+        timeout: int = 30,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        compress: bool = False,
+    ):
         """
         Initialize the Azure Monitor handler.
 
@@ -220,75 +441,201 @@ class AzureMonitorHandler(logging.Handler):
             workspace_key: Azure Log Analytics workspace key
             log_type: Custom log type name
             timeout: HTTP request timeout in seconds
+            batch_size: Number of buffered records that triggers an early flush
+            flush_interval: Seconds between background flushes of the buffer
+            max_buffer_size: Maximum number of buffered records (oldest are dropped when full)
+            compress: Whether to gzip-compress payloads of at least ``COMPRESS_MIN_BYTES``
         """
         super().__init__()
         self.workspace_id = workspace_id
         self.workspace_key = workspace_key
         self.log_type = log_type
         self.timeout = timeout
-        self.api_version = "2016-04-01"
-        self.resource = "/api/logs"
-        self.uri = f"https://{workspace_id}.ods.opinsights.azure.com{self.resource}?api-version={self.api_version}"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.compress = compress
+        self.api_version = self.API_VERSION
+        self.resource = self.RESOURCE
+        self.uri = f"https://{workspace_id}.ods.opinsights.azure.com{self.RESOURCE}?api-version={self.API_VERSION}"
+
+        # Signing inputs that never change; the key is decoded on the first send
+        self._decoded_key: Optional[bytes] = None
+        self._sig_suffix = f"\n{self.RESOURCE}".encode("ascii")
+        self._auth_prefix = f"SharedKey {workspace_id}:"
+
+        self._session: Optional[Any] = None
+
+        self._buffer: Deque[_AzureRecord] = deque(maxlen=max_buffer_size)
+        self._buffer_ready = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._shutdown = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+        # Pre-fork servers (gunicorn --preload, uWSGI) copy the handler into each worker
+        # without its flush thread; give every worker its own flusher, buffer and session
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=lambda ref=weakref.ref(self): _reset_handler_after_fork(ref))
+
+    def _reset_after_fork(self) -> None:
+        """Drop the parent's flush thread, locks, session and buffered records after a fork."""
+        self._buffer.clear()  # the parent process still sends these
+        self._buffer_ready = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._flush_thread = None
+        self._session = None  # its pooled sockets are shared with the parent
+
+    @property
+    def session(self) -> Any:
+        """The pooled requests session used for posting, created on first use."""
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> Any:
+        """
+        Create a keep-alive session that retries throttled and transient failures.
+
+        Returns:
+            A requests.Session with a retrying HTTPAdapter mounted for https://
+        """
+        requests = _get_requests()
+        # requests.adapters re-exports urllib3's Retry alongside HTTPAdapter
+        Retry = requests.adapters.Retry
+        retry_kwargs = {"total": 3, "backoff_factor": 0.2, "status_forcelist": RETRY_STATUS_CODES}
+        try:
+            # POST is not retried by default; the data collector API tolerates a resend
+            retry = Retry(allowed_methods=frozenset({"POST"}), raise_on_status=False, **retry_kwargs)
+        except TypeError:
+            # urllib3 < 1.26
+            retry = Retry(method_whitelist=frozenset({"POST"}), raise_on_status=False, **retry_kwargs)
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+        session.mount("https://", adapter)
+        return session
 
     def emit(self, record: logging.LogRecord):
         """
-        Emit a log record to Azure Monitor Logs.
+        Buffer a log record for delivery to Azure Monitor Logs.
 
         Args:
             record: Log record to emit
         """
         try:
-            # Format the log message
-            message = self.format(record)
-
-            # Prepare log data
-            log_data = {
-                "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat().replace("+00:00", "Z"),
-                "level": record.levelname,
-                "logger": record.name,
-                "message": message,
-                "module": record.module,
-                "function": record.funcName,
-                "line": record.lineno,
-                "thread": record.thread,
-                "process": record.process,
-            }
-
-            # Add any extra fields from the record
-            for key, value in record.__dict__.items():
-                if key not in [
-                    "name",
-                    "msg",
-                    "args",
-                    "levelname",
-                    "levelno",
-                    "pathname",
-                    "filename",
-                    "module",
-                    "lineno",
-                    "funcName",
-                    "created",
-                    "msecs",
-                    "relativeCreated",
-                    "thread",
-                    "threadName",
-                    "processName",
-                    "process",
-                    "getMessage",
-                    "stack_info",
-                    "exc_info",
-                    "exc_text",
-                ]:
-                    if not key.startswith("_"):
-                        log_data[key] = str(value) if value is not None else None
-
-            # Send to Azure Monitor
-            self._send_log_data([log_data])
+            if not _get_requests():
+                raise ImportError("requests library is required for Azure Monitor Logs")
+
+            # Without a formatter, format() is only getMessage() plus any exception text;
+            # skip the Formatter machinery for the common no-exception case
+            if self.formatter is None and not record.exc_info and not record.stack_info:
+                message = record.getMessage()
+            else:
+                message = self.format(record)
+
+            # Capture the record with extras snapshotted as JSON-safe values; the flush thread builds the entry
+            log_data = _AzureRecord(
+                record.created,
+                record.levelname,
+                record.name,
+                message,
+                record.module,
+                record.funcName,
+                record.lineno,
+                record.thread,
+                record.process,
+                {
+                    key: _extra_value(value)
+                    for key, value in record.__dict__.items()
+                    if key not in _LOGRECORD_STANDARD_ATTRS and not key.startswith("_")
+                },
+            )
+
+            with self._buffer_ready:
+                self._buffer.append(log_data)
+                if self._flush_thread is None:
+                    self._start_flush_thread()
+                elif len(self._buffer) >= self.batch_size:
+                    self._buffer_ready.notify()
 
         except Exception:
             # Don't let logging errors break the application
             self.handleError(record)
 
+    def flush(self):
+        """Send all buffered log records to Azure Monitor Logs."""
+        with self._send_lock:
+            while True:
+                payload = self._take_batch()
+                if payload is None:
+                    return
+                try:
+                    self._post_log_data(payload)
+                except Exception:
+                    # Don't let logging errors break the application
+                    if logging.raiseExceptions:
+                        traceback.print_exc(file=sys.stderr)
+
+    def close(self):
+        """Stop the background flusher and send any remaining log records."""
+        self._shutdown.set()
+        with self._buffer_ready:
+            self._buffer_ready.notify()
+        if self._flush_thread is not None and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=self.timeout)
+        self.flush()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        super().close()
+
+    def _start_flush_thread(self):
+        """Start the background thread that flushes the buffer."""
+        self._flush_thread = threading.Thread(target=self._flush_loop, name="AzureMonitorHandlerFlush", daemon=True)
+        self._flush_thread.start()
+
+    def _flush_loop(self):
+        """Flush every ``flush_interval`` seconds, or sooner once ``batch_size`` records are buffered."""
+        while not self._shutdown.is_set():
+            with self._buffer_ready:
+                self._buffer_ready.wait_for(
+                    lambda: self._shutdown.is_set() or len(self._buffer) >= self.batch_size,
+                    timeout=self.flush_interval,
+                )
+            self.flush()
+
+    def _take_batch(self) -> Optional[bytes]:
+        """
+        Pop buffered records and encode them as one JSON array within the API size limit.
+
+        Returns:
+            The JSON payload, or None if the buffer is empty
+        """
+        while True:
+            with self._buffer_ready:
+                log_data = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            if not log_data:
+                return None
+
+            # Encode outside the lock; records that would overflow the limit go back to the buffer
+            parts: List[bytes] = []
+            payload_bytes = 2
+            for index, entry in enumerate(log_data):
+                try:
+                    part = _dumps(entry.to_dict())
+                except Exception:
+                    # Drop only the record that cannot be encoded, never the batch or the flush thread
+                    if logging.raiseExceptions:
+                        traceback.print_exc(file=sys.stderr)
+                    continue
+                if parts and payload_bytes + len(part) + 1 > MAX_BATCH_BYTES:
+                    with self._buffer_ready:
+                        self._buffer.extendleft(reversed(log_data[index:]))
+                    break
+                parts.append(part)
+                payload_bytes += len(part) + 1
+            if parts:
+                return b"[" + b",".join(parts) + b"]"
+
     def _send_log_data(self, log_data: List[Dict[str, Any]]):
         """
         Send log data to Azure Monitor Logs.
@@ -296,40 +643,54 @@ class AzureMonitorHandler(logging.Handler):
         Args:
             log_data: List of log data dictionaries
         """
-        if not requests:
+        self._post_log_data(_dumps(log_data))
+
+    def _post_log_data(self, json_data: bytes):
+        """
+        Sign and post an encoded JSON payload to Azure Monitor Logs.
+
+        Args:
+            json_data: UTF-8 encoded JSON array of log records
+        """
+        if not _get_requests():
             raise ImportError("requests library is required for Azure Monitor Logs")
 
-        try:
-            # Convert log data to JSON
-            json_data = json.dumps(log_data)
-
-            # Build the signature
-            date_string = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")
-            content_length = len(json_data)
-
-            string_to_hash = f"POST\n{content_length}\napplication/json\nx-ms-date:{date_string}\n{self.resource}"
-            bytes_to_hash = bytes(string_to_hash, "UTF-8")
-            decoded_key = base64.b64decode(self.workspace_key)
-            encoded_hash = base64.b64encode(
-                hmac.new(decoded_key, bytes_to_hash, digestmod=hashlib.sha256).digest()
-            ).decode()
-            authorization = f"SharedKey {self.workspace_id}:{encoded_hash}"
-
-            # Build headers
-            headers = {
-                "content-type": "application/json",
-                "Authorization": authorization,
-                "Log-Type": self.log_type,
-                "x-ms-date": date_string,
-            }
-
-            # Send POST request
-            response = requests.post(self.uri, data=json_data, headers=headers, timeout=self.timeout)
-
-            # Check response
-            if response.status_code not in [200, 202]:
-                raise Exception(f"Azure Monitor API returned status code {response.status_code}: {response.text}")
+        # Level 1 trades a little ratio for roughly twice the speed of the default level
+        body = json_data
+        compressed = self.compress and len(json_data) >= COMPRESS_MIN_BYTES
+        if compressed:
+            body = gzip.compress(json_data, compresslevel=1)
+
+        # Build the signature; the content length is the byte length of the body as sent
+        date_string = formatdate(usegmt=True)
+        content_length = len(body)
+
+        if self._decoded_key is None:
+            self._decoded_key = base64.b64decode(self.workspace_key)
+        string_to_hash = (
+            b"POST\n"
+            + str(content_length).encode("ascii")
+            + b"\napplication/json\nx-ms-date:"
+            + date_string.encode("ascii")
+            + self._sig_suffix
+        )
+        # hmac.digest takes OpenSSL's one-shot path instead of building an HMAC object
+        mac = hmac.digest(self._decoded_key, string_to_hash, "sha256")
+        authorization = self._auth_prefix + base64.b64encode(mac).decode("ascii")
+
+        # Build headers
+        headers = {
+            "content-type": "application/json",
+            "Authorization": authorization,
+            "Log-Type": self.log_type,
+            "x-ms-date": date_string,
+        }
+        if compressed:
+            headers["Content-Encoding"] = "gzip"
 
-        except Exception:
-            # Re-raise the exception to be handled by the emit method
-            raise
+        # Send POST request
+        response = self.session.post(self.uri, data=body, headers=headers, timeout=self.timeout)
+
+        # Check response
+        if response.status_code not in [200, 202]:
+            raise Exception(f"Azure Monitor API returned status code {response.status_code}: {response.text}")
@@ -7,7 +7,8 @@ reducing code duplication and ensuring consistent behavior across all extensions
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from flask import Flask
 
@@ -15,6 +16,27 @@ from .compat import get_flask_env
 from .context_filter import FlaskRemoteLoggingContextFilter
 from .middleware import setup_middleware
 
+# Format used when no log_formatter is passed to an extension
+DEFAULT_LOG_FORMAT = (
+    "%(asctime)s - %(name)s - %(levelname)s - %(hostname)s: %(message)s "
+    "[in %(pathname)s:%(lineno)d]"
+    "params: %(get_params)s"
+)
+
+
+@lru_cache(maxsize=8)
+def _get_formatter(fmt: str) -> logging.Formatter:
+    """
+    Return a shared formatter for ``fmt``, so extensions do not each parse the same format.
+
+    Args:
+        fmt: Format string for the formatter
+
+    Returns:
+        A logging.Formatter shared by every caller using the same format string
+    """
+    return logging.Formatter(fmt)
+
 
 class BaseLoggingExtension(ABC):
     """
@@ -61,6 +83,10 @@ class BaseLoggingExtension(ABC):
         # Configuration and state
         self.config: Dict[str, Any] = {}
         self._logging_setup: bool = False
+        # Handler created by _setup_logging, reused by _configure_logger
+        self._handler: Optional[logging.Handler] = None
+        # Names of loggers this extension has already attached its handler to
+        self._configured_loggers: Set[str] = set()
 
         # Initialize with app if provided
         if app is not None:
@@ -87,11 +113,7 @@ class BaseLoggingExtension(ABC):
 
         # Create default log formatter if none provided
         if not self.log_formatter:
-            self.log_formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(hostname)s: %(message)s "
-                "[in %(pathname)s:%(lineno)d]"
-                "params: %(get_params)s"
-            )
+            self.log_formatter = _get_formatter(DEFAULT_LOG_FORMAT)
 
         # Apply middleware configuration override if present
         middleware_config_key = self._get_middleware_config_key()
@@ -104,8 +126,9 @@ class BaseLoggingExtension(ABC):
         if config_log_level is not None and self.log_level == logging.INFO:  # Only apply if still using default
             self.log_level = config_log_level
 
-        # Perform extension-specific initialization
-        self._init_backend()
+        # Perform extension-specific initialization, unless setup will be skipped anyway
+        if not self._should_skip_setup():
+            self._init_backend()
 
         # Set up logging and middleware
         self._setup_logging()
@@ -139,6 +162,8 @@ class BaseLoggingExtension(ABC):
         log_handler = self._create_log_handler()
 
         if log_handler:
+            self._handler = log_handler
+
             # Configure the handler
             log_handler.setLevel(self.log_level)
 
@@ -149,6 +174,8 @@ class BaseLoggingExtension(ABC):
             if hasattr(self.app, "logger"):
                 self.app.logger.addHandler(log_handler)
                 self.app.logger.setLevel(self.log_level)
+                if not self._should_propagate():
+                    self.app.logger.propagate = False
 
                 # Configure additional loggers
                 self._configure_additional_loggers(log_handler)
@@ -163,34 +190,59 @@ class BaseLoggingExtension(ABC):
 
     def _configure_additional_loggers(self, log_handler: logging.Handler) -> None:
         """
-        Configure additional loggers with the same handler and filters.
+        Configure additional loggers with the same handler (and so the same filters).
 
         Args:
             log_handler: The logging handler to attach to additional loggers
         """
-        if self.additional_logs:
-            for log_name in self.additional_logs:
-                additional_logger = logging.getLogger(log_name)
-                additional_logger.setLevel(self.log_level)
-                additional_logger.addHandler(log_handler)
-                if self.context_filter:
-                    additional_logger.addFilter(self.context_filter)
+        if not self.additional_logs:
+            return
+
+        # The context filter lives on the shared handler, so it is not added to each
+        # logger as well (that would run it twice per record)
+        disable_propagation = not self._should_propagate()
+
+        for log_name in self.additional_logs:
+            if log_name in self._configured_loggers:
+                continue
+            additional_logger = logging.getLogger(log_name)
+            additional_logger.setLevel(self.log_level)
+            additional_logger.addHandler(log_handler)
+            if disable_propagation:
+                additional_logger.propagate = False
+            self._configured_loggers.add(log_name)
 
     def _configure_logger(self, logger: logging.Logger, level: int) -> None:
         """
         Configure a logger with the extension's handler and level.
 
         This is a common pattern used by extensions for configuring loggers.
+        Loggers that were already configured by this extension are left untouched.
 
         Args:
             logger: The logger to configure
             level: The logging level to set
         """
-        if hasattr(self, "_handler") and self._handler:
+        if logger.name in self._configured_loggers:
+            return
+        if self._handler:
             logger.addHandler(self._handler)
             logger.setLevel(level)
-            if self.context_filter:
-                logger.addFilter(self.context_filter)
+            if not self._should_propagate():
+                logger.propagate = False
+            self._configured_loggers.add(logger.name)
+
+    def _should_propagate(self) -> bool:
+        """
+        Determine whether configured loggers should keep propagating to their parents.
+
+        Extensions can override this to stop records from also being handled by
+        ancestor (e.g. root) handlers once the extension's handler is attached.
+
+        Returns:
+            True to leave ``logger.propagate`` unchanged, False to disable propagation
+        """
+        return True
 
     def _get_flask_env(self) -> str:
         """
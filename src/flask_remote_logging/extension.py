@@ -81,24 +81,22 @@ class GraylogExtension(BaseLoggingExtension):
         if not self.app:
             raise RuntimeError("GraylogExtension must be initialized with a Flask app.")
 
-        app_name = self.app.config.get("GRAYLOG_APP_NAME", self.app.name)
+        config = self.app.config
+        app_name = config.get("GRAYLOG_APP_NAME", self.app.name)
+        environment = config.get("GRAYLOG_ENVIRONMENT", "production")
 
         return {
-            "GRAYLOG_HOST": self.app.config.get("GRAYLOG_HOST", "localhost"),
-            "GRAYLOG_PORT": self.app.config.get("GRAYLOG_PORT", 12201),
-            "GRAYLOG_LOG_LEVEL": self.app.config.get("GRAYLOG_LOG_LEVEL", logging.INFO),
+            "GRAYLOG_HOST": config.get("GRAYLOG_HOST", "localhost"),
+            "GRAYLOG_PORT": config.get("GRAYLOG_PORT", 12201),
+            "GRAYLOG_LOG_LEVEL": config.get("GRAYLOG_LOG_LEVEL", logging.INFO),
             "GRAYLOG_APP_NAME": app_name,
-            "GRAYLOG_SERVICE_NAME": self.app.config.get("GRAYLOG_SERVICE_NAME", app_name),
-            "GRAYLOG_ENVIRONMENT": self.app.config.get("GRAYLOG_ENVIRONMENT", "production"),
-            "FLASK_REMOTE_LOGGING_ENVIRONMENT": self.app.config.get(
-                "FLASK_REMOTE_LOGGING_ENVIRONMENT",
-                self.app.config.get("GRAYLOG_ENVIRONMENT", "production"),  # Backward compatibility
-            ),
-            "GRAYLOG_EXTRA_FIELDS": self.app.config.get("GRAYLOG_EXTRA_FIELDS", True),
-            "GRAYLOG_DEBUG": self.app.config.get("GRAYLOG_DEBUG", True),
-            "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE": self.app.config.get(
-                "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE", None
-            ),
+            "GRAYLOG_SERVICE_NAME": config.get("GRAYLOG_SERVICE_NAME", app_name),
+            "GRAYLOG_ENVIRONMENT": environment,
+            # GRAYLOG_ENVIRONMENT is honoured for backward compatibility
+            "FLASK_REMOTE_LOGGING_ENVIRONMENT": config.get("FLASK_REMOTE_LOGGING_ENVIRONMENT", environment),
+            "GRAYLOG_EXTRA_FIELDS": config.get("GRAYLOG_EXTRA_FIELDS", True),
+            "GRAYLOG_DEBUG": config.get("GRAYLOG_DEBUG", True),
+            "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE": config.get("FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE", None),
         }
 
     def _init_backend(self) -> None:
@@ -127,7 +125,7 @@ class GraylogExtension(BaseLoggingExtension):
             if GelfTcpHandler is None:
                 raise ImportError(
                     "pygelf is required for Graylog support. "
-                    "Install it with: pip install flask-network-logging[graylog]"
+                    "Install it with: pip install flask-remote-logging[graylog]"
                 )
 
             return cast(
@@ -74,21 +74,21 @@ class GCPLogExtension(BaseLoggingExtension):
         if not self.app:
             raise RuntimeError("GCPLogExtension must be initialized with a Flask app.")
 
-        app_name = self.app.config.get("GCP_APP_NAME", self.app.name)
+        config = self.app.config
+        app_name = config.get("GCP_APP_NAME", self.app.name)
+        environment = config.get("GCP_ENVIRONMENT", "production")
 
         return {
-            "GCP_PROJECT_ID": self.app.config.get("GCP_PROJECT_ID"),
-            "GCP_CREDENTIALS_PATH": self.app.config.get("GCP_CREDENTIALS_PATH"),
-            "GCP_LOG_NAME": self.app.config.get("GCP_LOG_NAME", "flask-app"),
-            "GCP_LOG_LEVEL": self.app.config.get("GCP_LOG_LEVEL", logging.INFO),
+            "GCP_PROJECT_ID": config.get("GCP_PROJECT_ID"),
+            "GCP_CREDENTIALS_PATH": config.get("GCP_CREDENTIALS_PATH"),
+            "GCP_LOG_NAME": config.get("GCP_LOG_NAME", "flask-app"),
+            "GCP_LOG_LEVEL": config.get("GCP_LOG_LEVEL", logging.INFO),
             "GCP_APP_NAME": app_name,
-            "GCP_SERVICE_NAME": self.app.config.get("GCP_SERVICE_NAME", app_name),
-            "GCP_ENVIRONMENT": self.app.config.get("GCP_ENVIRONMENT", "production"),
-            "FLASK_REMOTE_LOGGING_ENVIRONMENT": self.app.config.get(
-                "FLASK_REMOTE_LOGGING_ENVIRONMENT",
-                self.app.config.get("GCP_ENVIRONMENT", "production"),  # Backward compatibility
-            ),
-            "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE": self.app.config.get("FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE"),
+            "GCP_SERVICE_NAME": config.get("GCP_SERVICE_NAME", app_name),
+            "GCP_ENVIRONMENT": environment,
+            # GCP_ENVIRONMENT is honoured for backward compatibility
+            "FLASK_REMOTE_LOGGING_ENVIRONMENT": config.get("FLASK_REMOTE_LOGGING_ENVIRONMENT", environment),
+            "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE": config.get("FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE"),
         }
 
     def _init_backend(self) -> None:
@@ -6,19 +6,167 @@ to IBM Cloud Logs (formerly LogDNA). It integrates with the flask-network-loggin
 package to provide comprehensive logging capabilities for IBM Cloud environments.
 """
 
+import gzip
+import json
 import logging
 import os
 import socket
+import sys
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Union
+import traceback
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
 
 try:
     import requests
 except ImportError:
     requests = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .base_extension import BaseLoggingExtension
 
+# Default batching settings for IBMCloudLogHandler
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_BUFFER_SIZE = 10000
+DEFAULT_MAX_IN_FLIGHT = 4
+# Payloads smaller than this are not worth gzip-compressing
+COMPRESS_MIN_BYTES = 1024
+# Transient statuses retried by the session's transport adapter
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Python level names mapped to IBM Cloud Logs level names
+_LEVEL_MAP = {"DEBUG": "Debug", "INFO": "Info", "WARNING": "Warn", "ERROR": "Error", "CRITICAL": "Fatal"}
+# The same mapping keyed by LogRecord.levelno, used on the emit path
+_LEVELNO_MAP = {
+    logging.DEBUG: "Debug",
+    logging.INFO: "Info",
+    logging.WARNING: "Warn",
+    logging.ERROR: "Error",
+    logging.CRITICAL: "Fatal",
+}
+
+# Types the JSON encoder accepts as-is
+_JSON_SCALARS = (str, int, float, bool, type(None))
+# Range of integers orjson encodes natively; anything wider is sent as a string
+_INT_MIN = -(2**63)
+_INT_MAX = 2**64 - 1
+
+# LogRecord attributes that are not copied into the line's meta
+_RESERVED_RECORD_KEYS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "getMessage",
+        "task",
+        "asctime",
+    }
+)
+
+
+@lru_cache(maxsize=None)
+def _default_hostname() -> str:
+    """
+    Look up the system host name once per process.
+
+    Returns:
+        The result of ``socket.gethostname()``
+    """
+    return socket.gethostname()
+
+
+@lru_cache(maxsize=None)
+def _ibm_environment() -> Dict[str, Any]:
+    """
+    Read the IBM_* environment variables (and the host name) once per process.
+
+    Call ``_ibm_environment.cache_clear()`` to pick up environment changes.
+
+    Returns:
+        Dictionary of environment-derived IBM settings
+    """
+    return {
+        "IBM_INGESTION_KEY": os.getenv("IBM_INGESTION_KEY"),
+        "IBM_HOSTNAME": os.getenv("IBM_HOSTNAME") or _default_hostname(),
+        "IBM_LOG_LEVEL": os.getenv("IBM_LOG_LEVEL", logging.INFO),
+        "IBM_URL": os.getenv("IBM_URL", "https://logs.us-south.logging.cloud.ibm.com/logs/ingest"),
+        "IBM_ENVIRONMENT": os.getenv("IBM_ENVIRONMENT", "production"),
+        "IBM_MAC": os.getenv("IBM_MAC"),
+        "IBM_IP": os.getenv("IBM_IP"),
+        "IBM_TAGS": os.getenv("IBM_TAGS", ""),
+        "IBM_INDEX_META": os.getenv("IBM_INDEX_META", "false").lower() == "true",
+        "IBM_INCLUDE_META": os.getenv("IBM_INCLUDE_META", "true").lower() == "true",
+        "IBM_BATCH_SIZE": os.getenv("IBM_BATCH_SIZE", str(DEFAULT_BATCH_SIZE)),
+        "IBM_FLUSH_INTERVAL": os.getenv("IBM_FLUSH_INTERVAL", str(DEFAULT_FLUSH_INTERVAL)),
+        "IBM_QUEUE_MAXSIZE": os.getenv("IBM_QUEUE_MAXSIZE", str(DEFAULT_MAX_BUFFER_SIZE)),
+        "IBM_TIMEOUT": os.getenv("IBM_TIMEOUT", "30"),
+        "IBM_COMPRESSION": os.getenv("IBM_COMPRESSION", "gzip"),
+        "IBM_ON_FULL": os.getenv("IBM_ON_FULL", "drop"),
+    }
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. an integer wider than 64 bits inside a container; the stdlib encoder has no such limit
+            pass
+    return json.dumps(obj, default=str).encode("utf-8")
+
+
+def _json_safe(value: Any) -> Any:
+    """
+    Return ``value`` if it can be JSON encoded, otherwise its ``str()``.
+
+    Scalars, by far the common case for record attributes, are accepted without
+    invoking the encoder; only containers are test-encoded.
+
+    Args:
+        value: Extra attribute value from a log record
+
+    Returns:
+        A JSON-encodable value
+    """
+    if isinstance(value, _JSON_SCALARS):
+        if isinstance(value, int) and not _INT_MIN <= value <= _INT_MAX:
+            return str(value)
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        try:
+            json.dumps(value)
+            return value
+        except (TypeError, ValueError):
+            pass
+    return str(value)
+
 
 class IBMLogExtension(BaseLoggingExtension):
     """
@@ -98,34 +246,39 @@ class IBMLogExtension(BaseLoggingExtension):
         if not self.app:
             return {}
 
-        app_name = self.app.config.get("IBM_APP_NAME", getattr(self.app, "name", "flask-app"))
+        config = self.app.config
+        env = _ibm_environment()
+        app_name = config.get("IBM_APP_NAME", getattr(self.app, "name", "flask-app"))
+        environment = config.get("IBM_ENVIRONMENT", env["IBM_ENVIRONMENT"])
 
         return {
-            "IBM_INGESTION_KEY": self.app.config.get("IBM_INGESTION_KEY", os.getenv("IBM_INGESTION_KEY")),
-            "IBM_HOSTNAME": self.app.config.get("IBM_HOSTNAME", os.getenv("IBM_HOSTNAME", socket.gethostname())),
+            "IBM_INGESTION_KEY": config.get("IBM_INGESTION_KEY", env["IBM_INGESTION_KEY"]),
+            "IBM_HOSTNAME": config.get("IBM_HOSTNAME", env["IBM_HOSTNAME"]),
             "IBM_APP_NAME": app_name,
-            "IBM_LOG_LEVEL": self.app.config.get("IBM_LOG_LEVEL", os.getenv("IBM_LOG_LEVEL", logging.INFO)),
-            "IBM_URL": self.app.config.get(
-                "IBM_URL", os.getenv("IBM_URL", "https://logs.us-south.logging.cloud.ibm.com/logs/ingest")
-            ),
-            "IBM_ENVIRONMENT": self.app.config.get("IBM_ENVIRONMENT", os.getenv("IBM_ENVIRONMENT", "production")),
-            "FLASK_REMOTE_LOGGING_ENVIRONMENT": self.app.config.get(
-                "FLASK_REMOTE_LOGGING_ENVIRONMENT",
-                self.app.config.get(
-                    "IBM_ENVIRONMENT", os.getenv("IBM_ENVIRONMENT", "production")
-                ),  # Backward compatibility
-            ),
-            "IBM_MAC": self.app.config.get("IBM_MAC", os.getenv("IBM_MAC")),
-            "IBM_IP": self.app.config.get("IBM_IP", os.getenv("IBM_IP")),
-            "IBM_TAGS": self.app.config.get("IBM_TAGS", os.getenv("IBM_TAGS", "")),
-            "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE": self.app.config.get("FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE"),
+            "IBM_LOG_LEVEL": config.get("IBM_LOG_LEVEL", env["IBM_LOG_LEVEL"]),
+            "IBM_URL": config.get("IBM_URL", env["IBM_URL"]),
+            "IBM_ENVIRONMENT": environment,
+            # IBM_ENVIRONMENT is honoured for backward compatibility
+            "FLASK_REMOTE_LOGGING_ENVIRONMENT": config.get("FLASK_REMOTE_LOGGING_ENVIRONMENT", environment),
+            "IBM_MAC": config.get("IBM_MAC", env["IBM_MAC"]),
+            "IBM_IP": config.get("IBM_IP", env["IBM_IP"]),
+            "IBM_TAGS": config.get("IBM_TAGS", env["IBM_TAGS"]),
+            "IBM_INDEX_META": config.get("IBM_INDEX_META", env["IBM_INDEX_META"]),
+            "IBM_INCLUDE_META": config.get("IBM_INCLUDE_META", env["IBM_INCLUDE_META"]),
+            "IBM_BATCH_SIZE": config.get("IBM_BATCH_SIZE", env["IBM_BATCH_SIZE"]),
+            "IBM_FLUSH_INTERVAL": config.get("IBM_FLUSH_INTERVAL", env["IBM_FLUSH_INTERVAL"]),
+            "IBM_QUEUE_MAXSIZE": config.get("IBM_QUEUE_MAXSIZE", env["IBM_QUEUE_MAXSIZE"]),
+            "IBM_TIMEOUT": config.get("IBM_TIMEOUT", env["IBM_TIMEOUT"]),
+            "IBM_COMPRESSION": config.get("IBM_COMPRESSION", env["IBM_COMPRESSION"]),
+            "IBM_ON_FULL": config.get("IBM_ON_FULL", env["IBM_ON_FULL"]),
+            "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE": config.get("FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE"),
         }
 
     def _init_backend(self) -> None:
         """Initialize the IBM Cloud Logs backend."""
         # Extract configuration values
         self.ingestion_key = self.config.get("IBM_INGESTION_KEY")
-        self.hostname = self.config.get("IBM_HOSTNAME", socket.gethostname())
+        self.hostname = self.config.get("IBM_HOSTNAME") or _default_hostname()
         self.app_name = self.config.get("IBM_APP_NAME", "flask-app")
 
     def _init_ibm_config(self) -> None:
@@ -146,12 +299,20 @@ class IBMLogExtension(BaseLoggingExtension):
         try:
             return IBMCloudLogHandler(
                 ingestion_key=self.ingestion_key,
-                hostname=self.hostname or socket.gethostname(),
+                hostname=self.hostname or _default_hostname(),
                 app_name=self.app_name or "flask-app",
                 url=self.config.get("IBM_URL", "https://logs.us-south.logging.cloud.ibm.com/logs/ingest"),
                 mac=self.config.get("IBM_MAC"),
                 ip=self.config.get("IBM_IP"),
                 tags=self.config.get("IBM_TAGS", ""),
+                index_meta=bool(self.config.get("IBM_INDEX_META", False)),
+                include_meta=bool(self.config.get("IBM_INCLUDE_META", True)),
+                batch_size=int(self.config.get("IBM_BATCH_SIZE", DEFAULT_BATCH_SIZE)),
+                flush_interval=float(self.config.get("IBM_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL)),
+                max_buffer_size=int(self.config.get("IBM_QUEUE_MAXSIZE", DEFAULT_MAX_BUFFER_SIZE)),
+                timeout=float(self.config.get("IBM_TIMEOUT", 30)),
+                compress=str(self.config.get("IBM_COMPRESSION", "gzip")).lower() == "gzip",
+                block_when_full=str(self.config.get("IBM_ON_FULL", "drop")).lower() == "block",
             )
         except Exception:
             # Fallback to stream handler
@@ -184,13 +345,30 @@ class IBMLogExtension(BaseLoggingExtension):
         Configure a logger with IBM Cloud Logs handler.
 
         This method is expected by tests for backward compatibility.
+        Loggers that were already configured by this extension are left untouched,
+        and every logger shares a single handler.
         """
+        if logger.name in self._configured_loggers:
+            return
         logger.setLevel(level)
 
-        # Create and add handler
-        handler = self._create_log_handler()
-        if handler:
-            logger.addHandler(handler)
+        if self._handler is None:
+            self._handler = self._create_log_handler()
+        if self._handler:
+            logger.addHandler(self._handler)
+            self._configured_loggers.add(logger.name)
+
+
+def _reset_handler_after_fork(handler_ref: "weakref.ReferenceType[IBMCloudLogHandler]") -> None:
+    """
+    Reset a handler's flush state in a freshly forked child process.
+
+    Args:
+        handler_ref: Weak reference to the handler, so registration does not keep it alive
+    """
+    handler = handler_ref()
+    if handler is not None:
+        handler._reset_after_fork()
 
 
 class IBMCloudLogHandler(logging.Handler):
@@ -198,7 +376,8 @@ class IBMCloudLogHandler(logging.Handler):
     Custom logging handler for IBM Cloud Logs (formerly LogDNA).
 
     This handler sends log records to IBM Cloud Logs via HTTP API calls.
-    It supports batching, retries, and proper error handling.
+    Log lines are buffered in memory and posted in batches by a background thread,
+    so logging calls never wait on the network.
     """
 
     def __init__(
@@ -212,6 +391,14 @@ class IBMCloudLogHandler(logging.Handler):
         tags: Union[str, List[str]] = "",
         timeout: int = 30,
         level: int = logging.NOTSET,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        compress: bool = True,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        block_when_full: bool = False,
+        index_meta: bool = False,
+        include_meta: bool = True,
     ):
         """
         Initialize the IBM Cloud Log handler.
@@ -226,6 +413,14 @@ class IBMCloudLogHandler(logging.Handler):
             tags: Comma-separated tags string or list of tags (optional)
             timeout: Request timeout in seconds
             level: Logging level
+            batch_size: Maximum lines per post; a full batch triggers an early flush
+            flush_interval: Seconds between background flushes of the buffer
+            max_buffer_size: Maximum number of buffered lines (oldest are dropped when full)
+            compress: Whether to gzip-compress payloads of at least ``COMPRESS_MIN_BYTES``
+            max_in_flight: Maximum number of batches posted concurrently during a flush
+            block_when_full: Wait up to ``timeout`` for room in a full buffer instead of dropping the oldest line
+            index_meta: Ask IBM Cloud Logs to make each line's meta fields searchable
+            include_meta: Whether to attach record metadata to each line at all
         """
         super().__init__(level)
 
@@ -236,12 +431,15 @@ class IBMCloudLogHandler(logging.Handler):
             raise RuntimeError("requests library is required for IBM Cloud Logs integration")
 
         self.ingestion_key = ingestion_key
-        self.hostname = hostname or socket.gethostname()
+        self.hostname = hostname or _default_hostname()
         self.app_name = app_name
         self.url = url
         self.mac = mac
         self.ip = ip
         self.timeout = timeout
+        self.compress = compress
+        self.index_meta = index_meta
+        self.include_meta = include_meta
 
         # Handle tags parameter (can be string or list)
         if isinstance(tags, list):
@@ -252,6 +450,80 @@ class IBMCloudLogHandler(logging.Handler):
         # Add env attribute for backward compatibility
         self.env = "development"
 
+        # Fields that are the same on every line; emit copies this and fills in the rest
+        self._line_template: Dict[str, Any] = {"app": self.app_name}
+
+        # Query parameters that stay the same for every request
+        self._base_params: Dict[str, str] = {"hostname": self.hostname}
+        if self.ip:
+            self._base_params["ip"] = self.ip
+        if self.mac:
+            self._base_params["mac"] = self.mac
+        if self.tags:
+            self._base_params["tags"] = ",".join(self.tags)
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_in_flight = max(1, max_in_flight)
+        self._session: Optional[Any] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.block_when_full = block_when_full
+        self._buffer: Deque[Dict[str, Any]] = deque(maxlen=max_buffer_size)
+        # A full buffer must wake the flusher even when it holds less than a batch
+        self._flush_threshold = min(batch_size, max_buffer_size)
+        self._dropped = 0
+        self._buffer_ready = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._shutdown = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+        # Pre-fork servers (gunicorn --preload, uWSGI) copy the handler into each worker
+        # without its threads; give every worker its own flusher, sender pool and session
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=lambda ref=weakref.ref(self): _reset_handler_after_fork(ref))
+
+    def _reset_after_fork(self) -> None:
+        """Drop the parent's threads, locks, session and buffered lines after a fork."""
+        self._buffer.clear()  # the parent process still sends these
+        self._dropped = 0
+        self._buffer_ready = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._flush_thread = None
+        # The inherited executor has no live workers and the session's pooled sockets are shared with the parent
+        self._executor = None
+        self._session = None
+
+    @property
+    def session(self) -> Any:
+        """The pooled requests session used for posting, created on first use."""
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> Any:
+        """
+        Create a keep-alive session carrying the ingestion credentials and headers.
+
+        Returns:
+            A requests.Session with a retrying HTTPAdapter mounted for https://
+        """
+        # requests.adapters re-exports urllib3's Retry alongside HTTPAdapter
+        Retry = requests.adapters.Retry
+        retry_kwargs = {"total": 3, "backoff_factor": 0.3, "status_forcelist": RETRY_STATUS_CODES}
+        try:
+            # POST is not retried by default; a resent batch is preferable to a lost one
+            retry = Retry(allowed_methods=frozenset({"POST"}), raise_on_status=False, **retry_kwargs)
+        except TypeError:
+            # urllib3 < 1.26
+            retry = Retry(method_whitelist=frozenset({"POST"}), raise_on_status=False, **retry_kwargs)
+
+        session = requests.Session()
+        session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+        session.auth = (self.ingestion_key, "")  # LogDNA uses basic auth with key as username
+        session.headers.update({"Content-Type": "application/json", "User-Agent": "flask-network-logging-ibm/1.0.0"})
+        return session
+
     def _map_log_level(self, level_name: str) -> str:
         """
         Map Python log level names to IBM Cloud Logs level names.
@@ -262,8 +534,7 @@ class IBMCloudLogHandler(logging.Handler):
         Returns:
             IBM Cloud Logs level name
         """
-        level_mapping = {"DEBUG": "Debug", "INFO": "Info", "WARNING": "Warn", "ERROR": "Error", "CRITICAL": "Fatal"}
-        return level_mapping.get(level_name, "Info")
+        return _LEVEL_MAP.get(level_name, "Info")
 
     def emit(self, record: logging.LogRecord) -> None:
         """
@@ -273,69 +544,163 @@ class IBMCloudLogHandler(logging.Handler):
             record: The log record to emit
         """
         try:
-            # Format the log record
-            log_entry = self.format(record)
-
-            # Extract extra fields from the log record
-            meta = {
-                "hostname": self.hostname,
-                "logger": record.name,
-                "filename": record.filename,
-                "lineno": record.lineno,
-                "funcName": record.funcName,
-            }
-
-            # Add any extra fields from the record
-            reserved_attrs = {
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "getMessage",
-                "task",
-                "asctime",
-            }
-
-            for key, value in record.__dict__.items():
-                if key not in reserved_attrs:
-                    meta[key] = value
-
-            # Create the payload for IBM Cloud Logs
-            payload = {
-                "lines": [
-                    {
-                        "timestamp": int(record.created * 1000),  # Convert to milliseconds
-                        "line": log_entry,
-                        "app": self.app_name,
-                        "level": self._map_log_level(record.levelname),
-                        "meta": meta,
-                    }
-                ]
-            }
-
-            # Send to IBM Cloud Logs
-            self._send_to_ibm_logs(payload)
+            # Without a formatter, format() is only getMessage() plus any exception text;
+            # skip the Formatter machinery for the common no-exception case
+            if self.formatter is None and not record.exc_info and not record.stack_info:
+                log_entry = record.getMessage()
+            else:
+                log_entry = self.format(record)
+
+            log_line = self._line_template.copy()
+            log_line["timestamp"] = int(record.created * 1000)  # Convert to milliseconds
+            log_line["line"] = log_entry
+            log_line["level"] = _LEVELNO_MAP.get(record.levelno, "Info")
+
+            # Metadata is the bulk of each line; skip building it when it is not wanted
+            if self.include_meta:
+                meta = {
+                    "hostname": self.hostname,
+                    "logger": record.name,
+                    "filename": record.filename,
+                    "lineno": record.lineno,
+                    "funcName": record.funcName,
+                }
+
+                # Add any extra fields from the record
+                for key, value in record.__dict__.items():
+                    if key not in _RESERVED_RECORD_KEYS:
+                        meta[key] = _json_safe(value)
+
+                log_line["meta"] = meta
+                if self.index_meta:
+                    log_line["indexMeta"] = True
+
+            with self._buffer_ready:
+                if len(self._buffer) == self._buffer.maxlen:
+                    if self.block_when_full and self._flush_thread not in (None, threading.current_thread()):
+                        # Back-pressure: wake the flusher and wait for it to make room
+                        self._buffer_ready.notify_all()
+                        self._buffer_ready.wait_for(
+                            lambda: len(self._buffer) < self._buffer.maxlen or self._shutdown.is_set(),
+                            timeout=self.timeout,
+                        )
+                    if len(self._buffer) == self._buffer.maxlen:
+                        self._dropped += 1  # the append below evicts the oldest line
+                self._buffer.append(log_line)
+                if self._flush_thread is None:
+                    self._start_flush_thread()
+                elif len(self._buffer) >= self._flush_threshold:
+                    self._buffer_ready.notify()
 
         except Exception:
             # Don't let logging errors break the application
             self.handleError(record)
 
+    def flush(self) -> None:
+        """Send all buffered log lines to IBM Cloud Logs."""
+        with self._send_lock:
+            while True:
+                with self._buffer_ready:
+                    batches = []
+                    while self._buffer and len(batches) < self.max_in_flight:
+                        batches.append([self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))])
+                    dropped, self._dropped = self._dropped, 0
+                    if batches and self.block_when_full:
+                        self._buffer_ready.notify_all()
+                if dropped:
+                    notice = self._dropped_notice(dropped)
+                    if batches:
+                        batches[0].append(notice)
+                    else:
+                        batches.append([notice])
+                if not batches:
+                    return
+                if len(batches) == 1:
+                    self._post_batch(batches[0])
+                else:
+                    # Keep several batches in flight over the session's connection pool
+                    if self._executor is None:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_in_flight, thread_name_prefix="IBMCloudLogHandlerSend"
+                        )
+                    # Create the shared session here, under the send lock, so the senders cannot each build one
+                    if self._session is None:
+                        self._session = self._create_session()
+                    list(self._executor.map(self._post_batch, batches))
+
+    def _dropped_notice(self, dropped: int) -> Dict[str, Any]:
+        """
+        Build a log line reporting lines discarded because the buffer was full.
+
+        Args:
+            dropped: Number of discarded log lines
+
+        Returns:
+            A warning log line in the ingest API's format
+        """
+        return {
+            "timestamp": time.time_ns() // 1_000_000,
+            "line": f"IBMCloudLogHandler dropped {dropped} log lines because its buffer was full",
+            "app": self.app_name,
+            "level": "Warn",
+            "meta": {"hostname": self.hostname, "logger": __name__, "dropped": dropped},
+        }
+
+    def _post_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Post one batch of log lines, reporting rather than raising any failure.
+
+        Args:
+            batch: The log lines to send
+        """
+        try:
+            self._send_to_ibm_logs({"lines": batch})
+        except Exception:
+            # Don't let logging errors break the application
+            if logging.raiseExceptions:
+                traceback.print_exc(file=sys.stderr)
+
+    def close(self) -> None:
+        """Stop the background flusher and send any remaining log lines."""
+        # Nothing flushes the buffer after this, so later records are discarded up front
+        self.emit = self._discard  # type: ignore[method-assign]
+        self._shutdown.set()
+        with self._buffer_ready:
+            self._buffer_ready.notify()
+        if self._flush_thread is not None and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=self.timeout)
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        super().close()
+
+    def _discard(self, record: logging.LogRecord) -> None:
+        """
+        Replacement for emit once the handler is closed.
+
+        Args:
+            record: The log record, which is ignored
+        """
+
+    def _start_flush_thread(self) -> None:
+        """Start the background thread that flushes the buffer."""
+        self._flush_thread = threading.Thread(target=self._flush_loop, name="IBMCloudLogHandlerFlush", daemon=True)
+        self._flush_thread.start()
+
+    def _flush_loop(self) -> None:
+        """Flush every ``flush_interval`` seconds, or sooner once a batch is buffered or the buffer is full."""
+        while not self._shutdown.is_set():
+            with self._buffer_ready:
+                self._buffer_ready.wait_for(
+                    lambda: self._shutdown.is_set() or len(self._buffer) >= self._flush_threshold,
+                    timeout=self.flush_interval,
+                )
+            self.flush()
+
     def _send_log_data(self, payload: Dict[str, Any]) -> None:
         """
         Send log data to IBM Cloud Logs API (alternative method for tests).
@@ -362,38 +727,22 @@ class IBMCloudLogHandler(logging.Handler):
         Raises:
             Exception: If the API request fails
         """
-        try:
-            # Prepare headers
-            headers = {"Content-Type": "application/json", "User-Agent": "flask-network-logging-ibm/1.0.0"}
-
-            # Prepare query parameters
-            params = {"hostname": self.hostname, "now": int(time.time() * 1000)}  # Current timestamp in milliseconds
-
-            # Add optional parameters
-            if self.ip:
-                params["ip"] = self.ip
-            if self.mac:
-                params["mac"] = self.mac
-            if self.tags:
-                params["tags"] = ",".join(self.tags)
-
-            # Send POST request with basic auth
-            if requests:
-                response = requests.post(
-                    self.url,
-                    auth=(self.ingestion_key, ""),  # LogDNA uses basic auth with key as username
-                    headers=headers,
-                    params=params,
-                    json=payload,
-                    timeout=self.timeout,
-                )
+        if not requests:
+            raise RuntimeError("requests library is not available")
 
-                # Check response
-                if response.status_code not in [200, 202]:
-                    raise Exception(f"IBM Cloud Logs API returned status code {response.status_code}: {response.text}")
-            else:
-                raise RuntimeError("requests library is not available")
+        # Only the current timestamp (in milliseconds) changes between requests
+        params = {**self._base_params, "now": time.time_ns() // 1_000_000}
 
-        except Exception:
-            # Re-raise the exception to be handled by the emit method
-            raise
+        # Auth and headers (including the JSON content type) are set on the session
+        body = _dumps(payload)
+        headers = None
+        if self.compress and len(body) >= COMPRESS_MIN_BYTES:
+            # Level 1 trades a little ratio for roughly twice the speed of the default level
+            body = gzip.compress(body, compresslevel=1)
+            headers = {"Content-Encoding": "gzip"}
+
+        response = self.session.post(self.url, params=params, data=body, headers=headers, timeout=self.timeout)
+
+        # Check response
+        if response.status_code not in [200, 202]:
+            raise Exception(f"IBM Cloud Logs API returned status code {response.status_code}: {response.text}")
@@ -6,22 +6,135 @@ to Oracle Cloud Infrastructure Logging. It integrates with the flask-network-log
 provide comprehensive logging capabilities for OCI environments.
 """
 
+import itertools
 import logging
 import os
+import sys
+import threading
 import time
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+import traceback
+import uuid
+import weakref
+from collections import deque
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 try:
     import oci
-    from oci.exceptions import ConfigFileNotFound, ServiceError
+    from oci.exceptions import ClientError, ConfigFileNotFound, ServiceError
 except ImportError:
     oci = None
     ServiceError = Exception
     ConfigFileNotFound = Exception
+    ClientError = Exception
 
 from .base_extension import BaseLoggingExtension
 
+# Batching defaults for OCILogHandler
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_BUFFER_SIZE = 10000
+
+# Standard LogRecord attributes; anything else on a record is an extra field
+_LOGRECORD_STANDARD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "taskName",
+        "getMessage",
+        "stack_info",
+        "exc_info",
+        "exc_text",
+        "message",
+        "asctime",
+    }
+)
+
+# Extra field values sent as-is; anything else is sent as its str()
+_JSON_SCALARS = (str, int, float, bool)
+
+# Last whole second formatted by _format_timestamp, with its "YYYY-MM-DDTHH:MM:SS" text
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+
+@lru_cache(maxsize=None)
+def _oci_environment() -> Dict[str, Any]:
+    """
+    Read the OCI_* environment variables once per process.
+
+    Call ``_oci_environment.cache_clear()`` to pick up environment changes.
+
+    Returns:
+        Dictionary of environment-derived OCI settings
+    """
+    return {
+        "OCI_CONFIG_FILE": os.getenv("OCI_CONFIG_FILE", "~/.oci/config"),
+        "OCI_PROFILE": os.getenv("OCI_PROFILE", "DEFAULT"),
+        "OCI_LOG_GROUP_ID": os.getenv("OCI_LOG_GROUP_ID"),
+        "OCI_LOG_ID": os.getenv("OCI_LOG_ID"),
+        "OCI_LOG_LEVEL": os.getenv("OCI_LOG_LEVEL", logging.INFO),
+        "OCI_ENVIRONMENT": os.getenv("OCI_ENVIRONMENT", "production"),
+        "OCI_REGION": os.getenv("OCI_REGION"),
+        "OCI_COMPARTMENT_ID": os.getenv("OCI_COMPARTMENT_ID"),
+        "OCI_BATCH_SIZE": os.getenv("OCI_BATCH_SIZE", str(DEFAULT_BATCH_SIZE)),
+        "OCI_FLUSH_INTERVAL": os.getenv("OCI_FLUSH_INTERVAL", str(DEFAULT_FLUSH_INTERVAL)),
+        "OCI_QUEUE_MAXSIZE": os.getenv("OCI_QUEUE_MAXSIZE", str(DEFAULT_MAX_BUFFER_SIZE)),
+    }
+
+
+@lru_cache(maxsize=16)
+def _load_oci_config(config_file: str, profile: str) -> Dict[str, Any]:
+    """
+    Parse and validate a profile of an OCI config file once per process.
+
+    Call ``_load_oci_config.cache_clear()`` to pick up config file changes.
+
+    Args:
+        config_file: Path to the OCI config file
+        profile: Name of the profile to load
+
+    Returns:
+        The OCI SDK configuration dictionary (shared; copy it before modifying)
+    """
+    return oci.config.from_file(config_file, profile)
+
+
+def _format_timestamp(created: float) -> str:
+    """
+    Format a LogRecord creation time as an ISO 8601 UTC timestamp.
+
+    Records arrive in bursts within the same second, so the date and time part is
+    reused until the second changes and only the fraction is formatted per call.
+
+    Args:
+        created: Seconds since the epoch, as in ``LogRecord.created``
+
+    Returns:
+        Timestamp such as ``2024-01-31T12:00:00.123456Z``
+    """
+    global _timestamp_cache
+    second = int(created)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _timestamp_cache = (second, prefix)
+    return f"{prefix}.{int((created - second) * 1e6):06d}Z"
+
 
 class OCILogExtension(BaseLoggingExtension):
     """
@@ -101,25 +214,27 @@ class OCILogExtension(BaseLoggingExtension):
         if not self.app:
             return {}
 
-        app_name = self.app.config.get("OCI_APP_NAME", getattr(self.app, "name", "flask-app"))
+        config = self.app.config
+        env = _oci_environment()
+        app_name = config.get("OCI_APP_NAME", getattr(self.app, "name", "flask-app"))
+        environment = config.get("OCI_ENVIRONMENT", env["OCI_ENVIRONMENT"])
 
         return {
-            "OCI_CONFIG_FILE": self.app.config.get("OCI_CONFIG_FILE", os.getenv("OCI_CONFIG_FILE", "~/.oci/config")),
-            "OCI_PROFILE": self.app.config.get("OCI_PROFILE", os.getenv("OCI_PROFILE", "DEFAULT")),
-            "OCI_LOG_GROUP_ID": self.app.config.get("OCI_LOG_GROUP_ID", os.getenv("OCI_LOG_GROUP_ID")),
-            "OCI_LOG_ID": self.app.config.get("OCI_LOG_ID", os.getenv("OCI_LOG_ID")),
+            "OCI_CONFIG_FILE": config.get("OCI_CONFIG_FILE", env["OCI_CONFIG_FILE"]),
+            "OCI_PROFILE": config.get("OCI_PROFILE", env["OCI_PROFILE"]),
+            "OCI_LOG_GROUP_ID": config.get("OCI_LOG_GROUP_ID", env["OCI_LOG_GROUP_ID"]),
+            "OCI_LOG_ID": config.get("OCI_LOG_ID", env["OCI_LOG_ID"]),
             "OCI_APP_NAME": app_name,
-            "OCI_LOG_LEVEL": self.app.config.get("OCI_LOG_LEVEL", os.getenv("OCI_LOG_LEVEL", logging.INFO)),
-            "OCI_ENVIRONMENT": self.app.config.get("OCI_ENVIRONMENT", os.getenv("OCI_ENVIRONMENT", "production")),
-            "FLASK_REMOTE_LOGGING_ENVIRONMENT": self.app.config.get(
-                "FLASK_REMOTE_LOGGING_ENVIRONMENT",
-                self.app.config.get(
-                    "OCI_ENVIRONMENT", os.getenv("OCI_ENVIRONMENT", "production")
-                ),  # Backward compatibility
-            ),
-            "OCI_REGION": self.app.config.get("OCI_REGION", os.getenv("OCI_REGION")),
-            "OCI_COMPARTMENT_ID": self.app.config.get("OCI_COMPARTMENT_ID", os.getenv("OCI_COMPARTMENT_ID")),
-            "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE": self.app.config.get("FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE"),
+            "OCI_LOG_LEVEL": config.get("OCI_LOG_LEVEL", env["OCI_LOG_LEVEL"]),
+            "OCI_ENVIRONMENT": environment,
+            # Backward compatibility: fall back to OCI_ENVIRONMENT
+            "FLASK_REMOTE_LOGGING_ENVIRONMENT": config.get("FLASK_REMOTE_LOGGING_ENVIRONMENT", environment),
+            "OCI_REGION": config.get("OCI_REGION", env["OCI_REGION"]),
+            "OCI_COMPARTMENT_ID": config.get("OCI_COMPARTMENT_ID", env["OCI_COMPARTMENT_ID"]),
+            "OCI_BATCH_SIZE": config.get("OCI_BATCH_SIZE", env["OCI_BATCH_SIZE"]),
+            "OCI_FLUSH_INTERVAL": config.get("OCI_FLUSH_INTERVAL", env["OCI_FLUSH_INTERVAL"]),
+            "OCI_QUEUE_MAXSIZE": config.get("OCI_QUEUE_MAXSIZE", env["OCI_QUEUE_MAXSIZE"]),
+            "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE": config.get("FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE"),
         }
 
     def _init_backend(self) -> None:
@@ -130,15 +245,20 @@ class OCILogExtension(BaseLoggingExtension):
                 config_file = self.config.get("OCI_CONFIG_FILE", "~/.oci/config")
                 profile = self.config.get("OCI_PROFILE", "DEFAULT")
 
-                config = oci.config.from_file(config_file, profile)
-                self.logging_client = oci.logging.LoggingManagementClient(config)
+                config = dict(_load_oci_config(config_file, profile))
+                # The client's requests session keeps its connection alive between put_logs calls;
+                # retries happen on the handler's flush thread, never on a request thread
+                self.logging_client = oci.loggingingestion.LoggingClient(
+                    config, retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                )
 
                 # Store configuration values
                 self.log_group_id = self.config.get("OCI_LOG_GROUP_ID")
                 self.log_id = self.config.get("OCI_LOG_ID")
 
-            except Exception:
-                # If OCI initialization fails, we'll fallback to stream handler
+            except (ClientError, ServiceError, OSError, ValueError):
+                # Missing or invalid config/key files: fall back to the stream handler.
+                # Anything else is a bug and is left to propagate.
                 self.logging_client = None
 
     def _create_log_handler(self) -> Optional[logging.Handler]:
@@ -159,6 +279,9 @@ class OCILogExtension(BaseLoggingExtension):
                 app_name=self.config.get("OCI_APP_NAME", "flask-app"),
                 region=self.config.get("OCI_REGION"),
                 compartment_id=self.config.get("OCI_COMPARTMENT_ID"),
+                batch_size=int(self.config.get("OCI_BATCH_SIZE", DEFAULT_BATCH_SIZE)),
+                flush_interval=float(self.config.get("OCI_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL)),
+                max_buffer_size=int(self.config.get("OCI_QUEUE_MAXSIZE", DEFAULT_MAX_BUFFER_SIZE)),
             )
         except Exception:
             # Fallback to stream handler
@@ -187,11 +310,25 @@ class OCILogExtension(BaseLoggingExtension):
         return "FLASK_REMOTE_LOGGING_ENABLE_MIDDLEWARE"
 
 
+def _reset_handler_after_fork(handler_ref: "weakref.ReferenceType[OCILogHandler]") -> None:
+    """
+    Reset a handler's flush state in a freshly forked child process.
+
+    Args:
+        handler_ref: Weak reference to the handler, so registration does not keep it alive
+    """
+    handler = handler_ref()
+    if handler is not None:
+        handler._reset_after_fork()
+
+
 class OCILogHandler(logging.Handler):
     """
     Custom logging handler for Oracle Cloud Infrastructure Logging.
 
     This handler sends log records to OCI Logging via the OCI SDK.
+    Log entries are buffered in memory and sent in batches by a background thread,
+    so logging calls never wait on the network.
     """
 
     def __init__(
@@ -203,6 +340,9 @@ class OCILogHandler(logging.Handler):
         region: Optional[str] = None,
         compartment_id: Optional[str] = None,
         level: int = logging.NOTSET,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
     ):
         """
         Initialize the OCI Log handler.
@@ -215,6 +355,9 @@ class OCILogHandler(logging.Handler):
             region: OCI region
             compartment_id: OCI compartment ID
             level: Logging level
+            batch_size: Maximum entries per put_logs call; a full batch triggers an early flush
+            flush_interval: Seconds between background flushes of the buffer
+            max_buffer_size: Maximum number of buffered entries (oldest are dropped when full)
         """
         super().__init__(level)
 
@@ -232,6 +375,53 @@ class OCILogHandler(logging.Handler):
         self.region = region
         self.compartment_id = compartment_id
 
+        # Entry IDs are this handler's random prefix plus a running counter
+        self._id_prefix = uuid.uuid4().hex[:12]
+        self._id_counter = itertools.count()
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: Deque[Dict[str, Any]] = deque(maxlen=max_buffer_size)
+        self._dropped = 0
+        self._buffer_ready = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._shutdown = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+        # Pre-fork servers (gunicorn --preload, uWSGI) copy the handler into each worker
+        # without its flush thread; give every worker its own flusher and an empty buffer
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=lambda ref=weakref.ref(self): _reset_handler_after_fork(ref))
+
+    def _reset_after_fork(self) -> None:
+        """Drop the parent's flush thread, locks and buffered entries after a fork."""
+        self._buffer.clear()  # the parent process still sends these
+        self._dropped = 0
+        self._buffer_ready = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._flush_thread = None
+
+    def handle(self, record: logging.LogRecord) -> Any:
+        """
+        Filter and emit a record without taking the handler-wide lock.
+
+        ``emit`` only formats the record and appends to the buffer under its own
+        condition lock, so serializing every call on ``self.lock`` is unnecessary.
+
+        Args:
+            record: The log record to handle
+
+        Returns:
+            The result of the filters, as for ``logging.Handler.handle``
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            # Python 3.12+ filters may return a replacement record
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
     def emit(self, record: logging.LogRecord) -> None:
         """
         Emit a log record to OCI Logging.
@@ -240,12 +430,16 @@ class OCILogHandler(logging.Handler):
             record: The log record to emit
         """
         try:
-            # Format the log record
-            log_entry = self.format(record)
+            # Without a formatter, format() is only getMessage() plus any exception text;
+            # skip the Formatter machinery for the common no-exception case
+            if self.formatter is None and not record.exc_info and not record.stack_info:
+                log_entry = record.getMessage()
+            else:
+                log_entry = self.format(record)
 
             # Create the log entry for OCI
             log_entry_data = {
-                "time": datetime.fromtimestamp(record.created).isoformat() + "Z",
+                "time": _format_timestamp(record.created),
                 "data": {
                     "message": log_entry,
                     "level": record.levelname,
@@ -257,16 +451,95 @@ class OCILogHandler(logging.Handler):
                 },
             }
 
-            # Send to OCI Logging
-            self._send_to_oci_logging(log_entry_data)
+            # Extra fields (e.g. request and user context from the context filter), in one pass
+            extra = {
+                key: value if isinstance(value, _JSON_SCALARS) else str(value)
+                for key, value in record.__dict__.items()
+                if key not in _LOGRECORD_STANDARD_ATTRS and not key.startswith("_") and value is not None
+            }
+            if extra:
+                log_entry_data["data"]["extra"] = extra
+
+            with self._buffer_ready:
+                if len(self._buffer) == self._buffer.maxlen:
+                    self._dropped += 1  # the append below evicts the oldest entry
+                self._buffer.append(log_entry_data)
+                if self._flush_thread is None:
+                    self._start_flush_thread()
+                elif len(self._buffer) >= self.batch_size:
+                    self._buffer_ready.notify()
 
         except Exception:
             # Don't let logging errors break the application
             self.handleError(record)
 
+    def flush(self) -> None:
+        """Send all buffered log entries to OCI Logging."""
+        with self._send_lock:
+            while True:
+                with self._buffer_ready:
+                    batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                    dropped, self._dropped = self._dropped, 0
+                if dropped:
+                    batch.append(self._dropped_notice(dropped))
+                if not batch:
+                    return
+                try:
+                    self._send_log_entries(batch)
+                except Exception:
+                    # Don't let logging errors break the application
+                    if logging.raiseExceptions:
+                        traceback.print_exc(file=sys.stderr)
+
+    def _dropped_notice(self, dropped: int) -> Dict[str, Any]:
+        """
+        Build a log entry reporting entries discarded because the buffer was full.
+
+        Args:
+            dropped: Number of discarded log entries
+
+        Returns:
+            A warning log entry in the same shape as those built by emit
+        """
+        return {
+            "time": _format_timestamp(time.time()),
+            "data": {
+                "message": f"OCILogHandler dropped {dropped} log entries because its buffer was full",
+                "level": "WARNING",
+                "logger": __name__,
+                "app": self.app_name,
+                "dropped": dropped,
+            },
+        }
+
+    def close(self) -> None:
+        """Stop the background flusher and send any remaining log entries."""
+        self._shutdown.set()
+        with self._buffer_ready:
+            self._buffer_ready.notify()
+        if self._flush_thread is not None and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=30)
+        self.flush()
+        super().close()
+
+    def _start_flush_thread(self) -> None:
+        """Start the background thread that flushes the buffer."""
+        self._flush_thread = threading.Thread(target=self._flush_loop, name="OCILogHandlerFlush", daemon=True)
+        self._flush_thread.start()
+
+    def _flush_loop(self) -> None:
+        """Flush every ``flush_interval`` seconds, or sooner once ``batch_size`` entries are buffered."""
+        while not self._shutdown.is_set():
+            with self._buffer_ready:
+                self._buffer_ready.wait_for(
+                    lambda: self._shutdown.is_set() or len(self._buffer) >= self.batch_size,
+                    timeout=self.flush_interval,
+                )
+            self.flush()
+
     def _send_to_oci_logging(self, log_entry: Dict[str, Any]) -> None:
         """
-        Send log entry to OCI Logging.
+        Send a single log entry to OCI Logging.
 
         Args:
             log_entry: The log entry to send
@@ -274,34 +547,35 @@ class OCILogHandler(logging.Handler):
         Raises:
             Exception: If the OCI API request fails
         """
-        try:
-            if oci:
-                # Create the put logs request
-                put_logs_details = oci.logging.models.PutLogsDetails(
-                    specversion="1.0",
-                    log_entry_batches=[
-                        oci.logging.models.LogEntryBatch(
-                            entries=[
-                                oci.logging.models.LogEntry(
-                                    data=log_entry["data"],
-                                    id=str(int(time.time() * 1000)),  # Use timestamp as ID
-                                    time=log_entry["time"],
-                                )
-                            ],
-                            source=self.app_name,
-                            type="application/json",
-                        )
-                    ],
-                )
+        self._send_log_entries([log_entry])
 
-                # Send the logs
-                self.logging_client.put_logs(
-                    log_id=self.log_id,
-                    put_logs_details=put_logs_details,
-                )
-            else:
-                raise RuntimeError("OCI SDK is not available")
+    def _send_log_entries(self, log_entries: List[Dict[str, Any]]) -> None:
+        """
+        Send a batch of log entries to OCI Logging in one put_logs call.
 
-        except Exception:
-            # Re-raise the exception to be handled by the emit method
-            raise
+        Args:
+            log_entries: The log entries to send
+
+        Raises:
+            Exception: If the OCI API request fails
+        """
+        if not oci:
+            raise RuntimeError("OCI SDK is not available")
+
+        # Resolve the model classes once per batch rather than once per entry
+        models = oci.loggingingestion.models
+        log_entry_cls = models.LogEntry
+        id_prefix, id_counter = self._id_prefix, self._id_counter
+        entries = [
+            log_entry_cls(data=log_entry["data"], id=f"{id_prefix}-{next(id_counter)}", time=log_entry["time"])
+            for log_entry in log_entries
+        ]
+        put_logs_details = models.PutLogsDetails(
+            specversion="1.0",
+            log_entry_batches=[models.LogEntryBatch(entries=entries, source=self.app_name, type="application/json")],
+        )
+
+        self.logging_client.put_logs(
+            log_id=self.log_id,
+            put_logs_details=put_logs_details,
+        )
@@ -153,6 +153,16 @@ def isolate_flask_logger():
                 logger.removeHandler(handler)
 
 
+@pytest.fixture(autouse=True)
+def clear_oci_config_cache():
+    """Fixture to stop parsed OCI configs leaking between tests that patch the SDK."""
+    from flask_remote_logging.oci_extension import _load_oci_config
+
+    _load_oci_config.cache_clear()
+    yield
+    _load_oci_config.cache_clear()
+
+
 def clear_logger_handlers_safely(logger):
     """Safely clear logger handlers, avoiding Mock objects."""
     import logging
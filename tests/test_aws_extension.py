@@ -1,6 +1,8 @@
 """Tests for the AWSLogExtension class."""
 
 import logging
+import threading
+import weakref
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -32,10 +34,8 @@ class TestAWSLogExtension:
     def test_init_with_app(self, mock_boto3, app):
         """Test initialization with a Flask app."""
         # Mock boto3 session and client
-        mock_session = MagicMock()
         mock_client = MagicMock()
-        mock_boto3.Session.return_value = mock_session
-        mock_session.client.return_value = mock_client
+        mock_boto3.client.return_value = mock_client
 
         extension = AWSLogExtension(app=app)
 
@@ -68,10 +68,8 @@ class TestAWSLogExtension:
     @patch("flask_remote_logging.aws_extension.boto3")
     def test_init_app_method(self, mock_boto3, app):
         """Test the init_app method."""
-        mock_session = MagicMock()
         mock_client = MagicMock()
-        mock_boto3.Session.return_value = mock_session
-        mock_session.client.return_value = mock_client
+        mock_boto3.client.return_value = mock_client
 
         extension = AWSLogExtension()
         extension.init_app(app)
@@ -122,6 +120,66 @@ class TestAWSLogExtension:
         assert config["AWS_ENVIRONMENT"] == "production"
         assert config["AWS_CREATE_LOG_GROUP"] is False
 
+    def test_aws_config_resolved_once(self, app):
+        """Test that init_app resolves the config into an immutable AWSConfig."""
+        from flask_remote_logging.aws_extension import AWSConfig
+
+        app.config.update({"AWS_REGION": "us-west-2", "AWS_LOG_GROUP": "/aws/lambda/test"})
+
+        with patch("flask_remote_logging.aws_extension.boto3"):
+            extension = AWSLogExtension(app=app)
+
+        assert isinstance(extension.aws_config, AWSConfig)
+        assert extension.aws_config.region == "us-west-2"
+        assert extension.aws_config.log_group == "/aws/lambda/test"
+        assert extension.aws_config.create_log_group is True
+        with pytest.raises(AttributeError):
+            extension.aws_config.region = "eu-west-1"
+
+    def test_get_config_from_app_reads_environment_once(self, app, monkeypatch):
+        """Test that environment fallbacks are read once and cached."""
+        from flask_remote_logging.aws_extension import _aws_environment
+
+        _aws_environment.cache_clear()
+        monkeypatch.setenv("AWS_REGION", "ap-south-1")
+        monkeypatch.setenv("AWS_CREATE_LOG_GROUP", "false")
+
+        extension = AWSLogExtension()
+        extension.app = app
+        try:
+            config = extension._get_config_from_app()
+            assert config["AWS_REGION"] == "ap-south-1"
+            assert config["AWS_CREATE_LOG_GROUP"] is False
+
+            monkeypatch.setenv("AWS_REGION", "eu-central-1")
+            assert extension._get_config_from_app()["AWS_REGION"] == "ap-south-1"
+
+            # App config still takes precedence over the environment
+            app.config["AWS_REGION"] = "us-west-2"
+            assert extension._get_config_from_app()["AWS_REGION"] == "us-west-2"
+        finally:
+            _aws_environment.cache_clear()
+
+    @patch("flask_remote_logging.aws_extension.boto3")
+    def test_setup_logging_disables_propagation(self, mock_boto3, app):
+        """Test that loggers stop propagating to root handlers by default."""
+        app.config.update({"AWS_LOG_GROUP": "/aws/lambda/test"})
+
+        try:
+            AWSLogExtension(app=app)
+            assert app.logger.propagate is False
+        finally:
+            app.logger.propagate = True
+
+    @patch("flask_remote_logging.aws_extension.boto3")
+    def test_setup_logging_keeps_propagation_when_configured(self, mock_boto3, app):
+        """Test that AWS_LOG_PROPAGATE keeps logger propagation enabled."""
+        app.config.update({"AWS_LOG_GROUP": "/aws/lambda/test", "AWS_LOG_PROPAGATE": True})
+
+        AWSLogExtension(app=app)
+
+        assert app.logger.propagate is True
+
     def test_setup_logging_without_app(self):
         """Test _setup_logging without an app."""
         extension = AWSLogExtension()
@@ -132,10 +190,8 @@ class TestAWSLogExtension:
     @patch("flask_remote_logging.aws_extension.boto3")
     def test_setup_logging_with_aws_environment(self, mock_boto3, app):
         """Test _setup_logging in AWS environment."""
-        mock_session = MagicMock()
         mock_client = MagicMock()
-        mock_boto3.Session.return_value = mock_session
-        mock_session.client.return_value = mock_client
+        mock_boto3.client.return_value = mock_client
 
         app.config.update(
             {"AWS_ENVIRONMENT": "aws", "AWS_LOG_GROUP": "/aws/lambda/test", "AWS_LOG_STREAM": "test-stream"}
@@ -151,10 +207,8 @@ class TestAWSLogExtension:
     @patch("flask_remote_logging.aws_extension.boto3")
     def test_setup_logging_with_development_environment(self, mock_boto3, app):
         """Test _setup_logging in development environment."""
-        mock_session = MagicMock()
         mock_client = MagicMock()
-        mock_boto3.Session.return_value = mock_session
-        mock_session.client.return_value = mock_client
+        mock_boto3.client.return_value = mock_client
 
         app.config.update({"AWS_ENVIRONMENT": "development"})
 
@@ -166,10 +220,8 @@ class TestAWSLogExtension:
     @patch("flask_remote_logging.aws_extension.boto3")
     def test_init_cloudwatch_client_with_credentials(self, mock_boto3, app):
         """Test CloudWatch client initialization with explicit credentials."""
-        mock_session = MagicMock()
         mock_client = MagicMock()
-        mock_boto3.Session.return_value = mock_session
-        mock_session.client.return_value = mock_client
+        mock_boto3.client.return_value = mock_client
 
         app.config.update(
             {
@@ -183,18 +235,16 @@ class TestAWSLogExtension:
 
         extension = AWSLogExtension(app=app)
 
-        # Verify Session was called with correct parameters
-        mock_boto3.Session.assert_called_with(
-            region_name="us-west-2", aws_access_key_id="test-key", aws_secret_access_key="test-secret"
+        # Verify the client was created with correct parameters
+        mock_boto3.client.assert_called_with(
+            "logs", region_name="us-west-2", aws_access_key_id="test-key", aws_secret_access_key="test-secret"
         )
 
     @patch("flask_remote_logging.aws_extension.boto3")
     def test_init_cloudwatch_client_without_credentials(self, mock_boto3, app):
         """Test CloudWatch client initialization without explicit credentials."""
-        mock_session = MagicMock()
         mock_client = MagicMock()
-        mock_boto3.Session.return_value = mock_session
-        mock_session.client.return_value = mock_client
+        mock_boto3.client.return_value = mock_client
 
         app.config.update(
             {"AWS_REGION": "eu-west-1", "AWS_LOG_GROUP": "/aws/lambda/test", "AWS_LOG_STREAM": "test-stream"}
@@ -202,8 +252,8 @@ class TestAWSLogExtension:
 
         extension = AWSLogExtension(app=app)
 
-        # Verify Session was called with only region
-        mock_boto3.Session.assert_called_with(region_name="eu-west-1")
+        # Verify the client was created with only region
+        mock_boto3.client.assert_called_with("logs", region_name="eu-west-1")
 
     def test_init_cloudwatch_client_without_boto3(self, app):
         """Test CloudWatch client initialization when boto3 is not available."""
@@ -211,90 +261,156 @@ class TestAWSLogExtension:
             extension = AWSLogExtension(app=app)
             assert extension.cloudwatch_client is None
 
+    @patch("flask_remote_logging.aws_extension.boto3")
+    def test_cloudwatch_client_created_lazily(self, mock_boto3, app):
+        """Test that the boto3 client is only created when first needed."""
+        app.config.update(
+            {
+                "AWS_LOG_GROUP": "/aws/lambda/test",
+                "AWS_CREATE_LOG_GROUP": False,
+                "AWS_CREATE_LOG_STREAM": False,
+            }
+        )
+
+        extension = AWSLogExtension(app=app)
+        mock_boto3.client.assert_not_called()
+
+        client = extension.cloudwatch_client
+
+        mock_boto3.client.assert_called_once()
+        assert client is mock_boto3.client.return_value
+        assert extension.cloudwatch_client is client
+        mock_boto3.client.assert_called_once()
+
+    def test_boto3_imported_lazily(self, monkeypatch):
+        """Test that boto3 is only imported on first access, not at module load."""
+        from flask_remote_logging import aws_extension
+
+        monkeypatch.delitem(vars(aws_extension), "boto3", raising=False)
+        assert "boto3" not in vars(aws_extension)
+
+        assert aws_extension._get_boto3() is not None
+        assert "boto3" in vars(aws_extension)
+
     @patch("flask_remote_logging.aws_extension.boto3")
     def test_ensure_log_group_exists_success(self, mock_boto3, app):
         """Test ensuring log group exists when it already exists."""
-        mock_session = MagicMock()
-        mock_client = MagicMock()
-        mock_boto3.Session.return_value = mock_session
-        mock_session.client.return_value = mock_client
+        from botocore.exceptions import ClientError
 
-        # Mock successful describe_log_groups call
-        mock_client.describe_log_groups.return_value = {"logGroups": []}
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
 
         app.config.update({"AWS_LOG_GROUP": "/aws/lambda/test", "AWS_ENVIRONMENT": "development"})
 
         extension = AWSLogExtension()
         extension.init_app(app)
-        # Reset mock call counts since init_app may call it
+        # Reset mock call counts and the existence cache since init_app may call it
         mock_client.reset_mock()
+        extension._ensured_log_groups.clear()
 
-        extension._ensure_log_group_exists()
+        # Mock create_log_group reporting that the group already exists
+        mock_client.create_log_group.side_effect = ClientError(
+            {"Error": {"Code": "ResourceAlreadyExistsException"}}, "CreateLogGroup"
+        )
+
+        with patch.object(app.logger, "warning") as mock_warning:
+            extension._ensure_log_group_exists()
+            mock_warning.assert_not_called()
 
-        mock_client.describe_log_groups.assert_called_once_with(logGroupNamePrefix="/aws/lambda/test")
-        mock_client.create_log_group.assert_not_called()
+        mock_client.create_log_group.assert_called_once_with(logGroupName="/aws/lambda/test")
+        mock_client.describe_log_groups.assert_not_called()
+        assert "/aws/lambda/test" in extension._ensured_log_groups
 
     @patch("flask_remote_logging.aws_extension.boto3")
     def test_ensure_log_group_exists_create(self, mock_boto3, app):
         """Test ensuring log group exists when it needs to be created."""
-        from botocore.exceptions import ClientError
-
-        mock_session = MagicMock()
         mock_client = MagicMock()
-        mock_boto3.Session.return_value = mock_session
-        mock_session.client.return_value = mock_client
-
-        # Mock describe_log_groups to raise ClientError (not found)
-        mock_client.describe_log_groups.side_effect = ClientError(
-            {"Error": {"Code": "ResourceNotFoundException"}}, "DescribeLogGroups"
-        )
+        mock_boto3.client.return_value = mock_client
 
         app.config.update({"AWS_LOG_GROUP": "/aws/lambda/test", "AWS_ENVIRONMENT": "development"})
 
         extension = AWSLogExtension()
         extension.init_app(app)
-        # Reset mock call counts since init_app may call it
+        # Reset mock call counts and the existence cache since init_app may call it
         mock_client.reset_mock()
-        mock_client.describe_log_groups.side_effect = ClientError(
-            {"Error": {"Code": "ResourceNotFoundException"}}, "DescribeLogGroups"
-        )
+        extension._ensured_log_groups.clear()
 
         with patch.object(app.logger, "info") as mock_info:
             extension._ensure_log_group_exists()
             mock_client.create_log_group.assert_called_once_with(logGroupName="/aws/lambda/test")
             mock_info.assert_called_with("Created CloudWatch log group: /aws/lambda/test")
 
+    @patch("flask_remote_logging.aws_extension.boto3")
+    def test_ensure_log_group_exists_failure(self, mock_boto3, app):
+        """Test that other create_log_group errors are logged and not cached."""
+        from botocore.exceptions import ClientError
+
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+
+        app.config.update({"AWS_LOG_GROUP": "/aws/lambda/test", "AWS_ENVIRONMENT": "development"})
+
+        extension = AWSLogExtension()
+        extension.init_app(app)
+        mock_client.reset_mock()
+        extension._ensured_log_groups.clear()
+
+        mock_client.create_log_group.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException"}}, "CreateLogGroup"
+        )
+
+        with patch.object(app.logger, "warning") as mock_warning:
+            extension._ensure_log_group_exists()
+            mock_warning.assert_called_once()
+
+        assert "/aws/lambda/test" not in extension._ensured_log_groups
+
     @patch("flask_remote_logging.aws_extension.boto3")
     def test_ensure_log_stream_exists_success(self, mock_boto3, app):
         """Test ensuring log stream exists when it already exists."""
-        mock_session = MagicMock()
-        mock_client = MagicMock()
-        mock_boto3.Session.return_value = mock_session
-        mock_session.client.return_value = mock_client
+        from botocore.exceptions import ClientError
 
-        # Mock successful describe_log_streams call
-        mock_client.describe_log_streams.return_value = {"logStreams": []}
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
 
         app.config.update({"AWS_LOG_GROUP": "/aws/lambda/test", "AWS_LOG_STREAM": "test-stream"})
 
         extension = AWSLogExtension(app=app)
 
-        # Reset mock to only track calls made after automatic setup
-        mock_client.describe_log_streams.reset_mock()
+        # Reset mock and existence cache to only track calls made after automatic setup
+        mock_client.create_log_stream.reset_mock()
+        extension._ensured_log_streams.clear()
+        mock_client.create_log_stream.side_effect = ClientError(
+            {"Error": {"Code": "ResourceAlreadyExistsException"}}, "CreateLogStream"
+        )
         extension._ensure_log_stream_exists()
 
-        mock_client.describe_log_streams.assert_called_once_with(
-            logGroupName="/aws/lambda/test", logStreamNamePrefix="test-stream"
+        mock_client.create_log_stream.assert_called_once_with(
+            logGroupName="/aws/lambda/test", logStreamName="test-stream"
         )
-        mock_client.create_log_stream.assert_not_called()
+        mock_client.describe_log_streams.assert_not_called()
+        assert ("/aws/lambda/test", "test-stream") in extension._ensured_log_streams
+
+    @patch("flask_remote_logging.aws_extension.boto3")
+    def test_ensure_log_group_and_stream_checked_once(self, mock_boto3, app):
+        """Test that existence checks are cached after the first successful call."""
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+
+        app.config.update({"AWS_LOG_GROUP": "/aws/lambda/test", "AWS_LOG_STREAM": "test-stream"})
+
+        extension = AWSLogExtension(app=app)
+        extension._ensure_log_group_exists()
+        extension._ensure_log_stream_exists()
+
+        mock_client.create_log_group.assert_called_once()
+        mock_client.create_log_stream.assert_called_once()
 
     @patch("flask_remote_logging.aws_extension.boto3")
     def test_setup_logging_with_context_filter(self, mock_boto3, app):
         """Test _setup_logging with custom context filter."""
-        mock_session = MagicMock()
         mock_client = MagicMock()
-        mock_boto3.Session.return_value = mock_session
-        mock_session.client.return_value = mock_client
+        mock_boto3.client.return_value = mock_client
 
         custom_filter = Mock(spec=logging.Filter)
 
@@ -308,10 +424,8 @@ class TestAWSLogExtension:
     @patch("flask_remote_logging.aws_extension.boto3")
     def test_setup_logging_with_additional_logs(self, mock_boto3, app):
         """Test _setup_logging with additional loggers."""
-        mock_session = MagicMock()
         mock_client = MagicMock()
-        mock_boto3.Session.return_value = mock_session
-        mock_session.client.return_value = mock_client
+        mock_boto3.client.return_value = mock_client
 
         app.config.update({"AWS_ENVIRONMENT": "production", "AWS_LOG_GROUP": "/aws/lambda/test"})
 
@@ -356,6 +470,55 @@ class TestAWSLogExtension:
             # The extension should use the parameter value, not config
             assert extension.log_level == logging.DEBUG
 
+    @patch("flask_remote_logging.aws_extension.boto3")
+    def test_cloudwatch_handler_uses_json_formatter_by_default(self, mock_boto3, app):
+        """Test that the CloudWatch handler formats records as JSON when no formatter is given."""
+        from flask_remote_logging.aws_extension import CloudWatchJsonFormatter
+
+        app.config.update({"AWS_ENVIRONMENT": "production", "AWS_LOG_GROUP": "/aws/lambda/test"})
+
+        extension = AWSLogExtension(app=app)
+        handler = extension._create_log_handler()
+
+        assert isinstance(handler.formatter, CloudWatchJsonFormatter)
+
+    @patch("flask_remote_logging.aws_extension.boto3")
+    def test_cloudwatch_handler_keeps_custom_formatter(self, mock_boto3, app):
+        """Test that a user-supplied formatter is not replaced by the JSON formatter."""
+        custom_formatter = logging.Formatter("%(message)s")
+        app.config.update({"AWS_ENVIRONMENT": "production", "AWS_LOG_GROUP": "/aws/lambda/test"})
+
+        extension = AWSLogExtension(app=app, log_formatter=custom_formatter)
+        handler = extension._create_log_handler()
+
+        assert handler.formatter is custom_formatter
+
+
+class TestCloudWatchJsonFormatter:
+    """Test cases for the CloudWatchJsonFormatter class."""
+
+    def test_format_produces_json(self):
+        """Test that records are rendered as a JSON object."""
+        import json
+
+        from flask_remote_logging.aws_extension import CloudWatchJsonFormatter
+
+        formatter = CloudWatchJsonFormatter(environment="production")
+        record = logging.LogRecord(
+            name="test", level=logging.WARNING, pathname="", lineno=0, msg="Hello %s", args=("world",), exc_info=None
+        )
+        record.created = 1.5
+
+        entry = json.loads(formatter.format(record))
+
+        assert entry == {
+            "timestamp": 1500,
+            "level": "WARNING",
+            "logger": "test",
+            "message": "Hello world",
+            "environment": "production",
+        }
+
 
 class TestCloudWatchHandler:
     """Test cases for the CloudWatchHandler class."""
@@ -389,6 +552,7 @@ class TestCloudWatchHandler:
         )
 
         handler.emit(record)
+        handler.flush()
 
         # Verify put_log_events was called
         mock_client.put_log_events.assert_called_once()
@@ -421,6 +585,7 @@ class TestCloudWatchHandler:
         )
 
         handler.emit(record)
+        handler.flush()
 
         # Verify put_log_events was called with sequence token
         mock_client.put_log_events.assert_called_once()
@@ -453,7 +618,168 @@ class TestCloudWatchHandler:
         )
 
         handler.emit(record)
+        handler.flush()
 
         # Verify put_log_events was called twice (retry after invalid token)
         assert mock_client.put_log_events.call_count == 2
         assert handler.sequence_token == "new_token"
+
+    def test_cloudwatch_handler_client_factory(self):
+        """Test that the handler resolves its client from the factory on first send."""
+        from flask_remote_logging.aws_extension import CloudWatchHandler
+
+        mock_client = Mock()
+        mock_client.put_log_events.return_value = {}
+        factory = Mock(return_value=mock_client)
+
+        handler = CloudWatchHandler(
+            client=None, log_group="/aws/lambda/test", log_stream="test-stream", client_factory=factory
+        )
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="", lineno=0, msg="Test message", args=(), exc_info=None
+        )
+        handler.emit(record)
+        factory.assert_not_called()
+
+        handler.flush()
+
+        factory.assert_called_once()
+        mock_client.put_log_events.assert_called_once()
+
+    def test_cloudwatch_handler_batches_records(self):
+        """Test that buffered records are sent in a single, time-ordered batch."""
+        from flask_remote_logging.aws_extension import CloudWatchHandler
+
+        mock_client = Mock()
+        mock_client.put_log_events.return_value = {}
+
+        handler = CloudWatchHandler(client=mock_client, log_group="/aws/lambda/test", log_stream="test-stream")
+
+        for created, msg in ((2.0, "second"), (1.0, "first"), (3.0, "third")):
+            record = logging.LogRecord(
+                name="test", level=logging.INFO, pathname="", lineno=0, msg=msg, args=(), exc_info=None
+            )
+            record.created = created
+            handler.emit(record)
+
+        mock_client.put_log_events.assert_not_called()
+        handler.flush()
+
+        mock_client.put_log_events.assert_called_once()
+        events = mock_client.put_log_events.call_args[1]["logEvents"]
+        assert [event["message"] for event in events] == ["first", "second", "third"]
+
+    def test_cloudwatch_handler_splits_batches_by_size(self):
+        """Test that a flush splits events that exceed the PutLogEvents payload limit."""
+        from flask_remote_logging.aws_extension import MAX_BATCH_BYTES, CloudWatchHandler
+
+        mock_client = Mock()
+        mock_client.put_log_events.return_value = {}
+
+        handler = CloudWatchHandler(client=mock_client, log_group="/aws/lambda/test", log_stream="test-stream")
+
+        big_message = "x" * (MAX_BATCH_BYTES // 2)
+        for _ in range(3):
+            record = logging.LogRecord(
+                name="test", level=logging.INFO, pathname="", lineno=0, msg=big_message, args=(), exc_info=None
+            )
+            handler.emit(record)
+
+        handler.flush()
+
+        assert mock_client.put_log_events.call_count == 3
+
+    def test_cloudwatch_handler_close_flushes(self):
+        """Test that closing the handler sends any buffered records."""
+        from flask_remote_logging.aws_extension import CloudWatchHandler
+
+        mock_client = Mock()
+        mock_client.put_log_events.return_value = {}
+
+        handler = CloudWatchHandler(client=mock_client, log_group="/aws/lambda/test", log_stream="test-stream")
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="", lineno=0, msg="Test message", args=(), exc_info=None
+        )
+        handler.emit(record)
+        handler.close()
+
+        mock_client.put_log_events.assert_called_once()
+
+    def test_cloudwatch_handler_reports_dropped_events(self):
+        """Test that events evicted from a full buffer are counted and reported in the next batch."""
+        from flask_remote_logging.aws_extension import CloudWatchHandler
+
+        mock_client = Mock()
+        mock_client.put_log_events.return_value = {}
+        handler = CloudWatchHandler(
+            client=mock_client, log_group="/aws/lambda/test", log_stream="test-stream", max_buffer_size=2
+        )
+        handler._start_flush_thread = Mock()  # keep delivery on the test thread
+
+        for i in range(5):
+            handler.emit(logging.makeLogRecord({"name": "test", "msg": f"message {i}", "created": float(i)}))
+        assert handler._dropped == 3
+        handler.flush()
+
+        events = mock_client.put_log_events.call_args[1]["logEvents"]
+        assert [event["message"] for event in events[:2]] == ["message 3", "message 4"]
+        assert "dropped 3 log events" in events[2]["message"]
+        assert handler._dropped == 0
+        handler.close()
+
+    def test_cloudwatch_handler_flushes_full_batch_early(self):
+        """Test that the flush thread sends as soon as batch_size events are buffered."""
+        from flask_remote_logging.aws_extension import CloudWatchHandler
+
+        sent = threading.Event()
+        mock_client = Mock()
+        mock_client.put_log_events.side_effect = lambda **kwargs: sent.set() or {}
+        handler = CloudWatchHandler(
+            client=mock_client, log_group="/aws/lambda/test", log_stream="test-stream", flush_interval=60, batch_size=2
+        )
+
+        handler.emit(logging.makeLogRecord({"name": "test", "msg": "first"}))
+        handler.emit(logging.makeLogRecord({"name": "test", "msg": "second"}))
+
+        assert sent.wait(timeout=5)
+        handler.close()
+        assert not handler._flush_thread.is_alive()
+        mock_client.put_log_events.assert_called_once()
+
+    def test_cloudwatch_handler_reset_after_fork_restarts_flusher_in_child(self):
+        """Test that a forked worker gets a fresh flusher instead of the parent's dead thread."""
+        from flask_remote_logging.aws_extension import CloudWatchHandler, _reset_handler_after_fork
+
+        handler = CloudWatchHandler(client=Mock(), log_group="/aws/lambda/test", log_stream="test-stream")
+        handler._start_flush_thread = Mock()
+        handler.emit(logging.makeLogRecord({"name": "test", "msg": "buffered before fork"}))
+        handler._flush_thread = Mock()  # stands in for the parent's thread, which does not exist in a child
+        send_lock = handler._send_lock
+
+        _reset_handler_after_fork(weakref.ref(handler))
+
+        assert handler._flush_thread is None
+        assert handler._send_lock is not send_lock
+        assert not handler._buffer
+        handler.emit(logging.makeLogRecord({"name": "test", "msg": "logged in the worker"}))
+        assert handler._start_flush_thread.call_count == 2
+        handler._buffer.clear()
+        handler.close()
+
+    def test_cloudwatch_handler_invalid_sequence_token_retries_once(self):
+        """Test that a persistently invalid sequence token does not retry forever."""
+        from botocore.exceptions import ClientError
+
+        from flask_remote_logging.aws_extension import CloudWatchHandler
+
+        mock_client = Mock()
+        mock_client.put_log_events.side_effect = ClientError(
+            {"Error": {"Code": "InvalidSequenceTokenException"}}, "PutLogEvents"
+        )
+
+        handler = CloudWatchHandler(client=mock_client, log_group="/aws/lambda/test", log_stream="test-stream")
+
+        with pytest.raises(ClientError):
+            handler._send_log_events([{"timestamp": 0, "message": "Test message"}])
+
+        assert mock_client.put_log_events.call_count == 2
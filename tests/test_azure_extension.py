@@ -1,19 +1,39 @@
 """Tests for the Azure Monitor Logs extension."""
 
+import base64
+import gzip
+import hashlib
+import hmac
 import json
 import logging
+import sys
+import weakref
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from flask import Flask
 
-from flask_remote_logging.azure_extension import AzureLogExtension, AzureMonitorHandler
+from flask_remote_logging.azure_extension import AzureLogExtension, AzureMonitorHandler, _format_timestamp
 from flask_remote_logging.context_filter import FlaskRemoteLoggingContextFilter
 
 
 class TestAzureLogExtension:
     """Test cases for the AzureLogExtension class."""
 
+    @pytest.fixture(autouse=True)
+    def close_installed_handlers(self):
+        """Detach and close the handlers a test's extension installed, discarding any buffered records."""
+        yield
+        loggers = [logging.getLogger()]
+        loggers += [obj for obj in logging.Logger.manager.loggerDict.values() if isinstance(obj, logging.Logger)]
+        for logger in loggers:
+            for handler in list(logger.handlers):
+                if isinstance(handler, AzureMonitorHandler):
+                    logger.removeHandler(handler)
+                    handler._buffer.clear()
+                    handler.close()
+
     def test_init_without_app(self):
         """Test extension initialization without Flask app."""
         extension = AzureLogExtension()
@@ -85,6 +105,8 @@ class TestAzureLogExtension:
         assert config["AZURE_LOG_LEVEL"] == "INFO"
         assert config["AZURE_ENVIRONMENT"] == "development"
         assert config["AZURE_TIMEOUT"] == "30"
+        assert config["AZURE_BATCH_SIZE"] == "500"
+        assert config["AZURE_FLUSH_INTERVAL"] == "1.0"
 
     def test_get_config_from_app_with_custom_values(self):
         """Test config extraction with custom values."""
@@ -97,6 +119,8 @@ class TestAzureLogExtension:
                 "AZURE_LOG_LEVEL": "DEBUG",
                 "AZURE_ENVIRONMENT": "production",
                 "AZURE_TIMEOUT": "60",
+                "AZURE_BATCH_SIZE": "50",
+                "AZURE_FLUSH_INTERVAL": "5",
             }
         )
 
@@ -109,6 +133,29 @@ class TestAzureLogExtension:
         assert config["AZURE_LOG_LEVEL"] == "DEBUG"
         assert config["AZURE_ENVIRONMENT"] == "production"
         assert config["AZURE_TIMEOUT"] == "60"
+        assert config["AZURE_BATCH_SIZE"] == "50"
+        assert config["AZURE_FLUSH_INTERVAL"] == "5"
+
+    def test_get_config_from_app_reads_environment_once(self, monkeypatch):
+        """Test that environment fallbacks are read once and cached."""
+        from flask_remote_logging.azure_extension import _azure_environment
+
+        _azure_environment.cache_clear()
+        monkeypatch.setenv("AZURE_LOG_TYPE", "EnvLogs")
+
+        extension = AzureLogExtension()
+        extension.app = Flask(__name__)
+        try:
+            assert extension._get_config_from_app()["AZURE_LOG_TYPE"] == "EnvLogs"
+
+            monkeypatch.setenv("AZURE_LOG_TYPE", "ChangedLogs")
+            assert extension._get_config_from_app()["AZURE_LOG_TYPE"] == "EnvLogs"
+
+            # App config still takes precedence over the environment
+            extension.app.config["AZURE_LOG_TYPE"] = "AppLogs"
+            assert extension._get_config_from_app()["AZURE_LOG_TYPE"] == "AppLogs"
+        finally:
+            _azure_environment.cache_clear()
 
     def test_setup_logging_without_app(self):
         """Test setup logging when no app is configured."""
@@ -274,6 +321,13 @@ class TestAzureLogExtension:
 class TestAzureMonitorHandler:
     """Test cases for the AzureMonitorHandler class."""
 
+    def test_format_timestamp_matches_isoformat(self):
+        """Test that record timestamps are formatted as ISO 8601 UTC."""
+        created = 1700000000.25
+        expected = datetime.fromtimestamp(created, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+        assert _format_timestamp(created) == expected
+
     def test_azure_monitor_handler_init(self):
         """Test Azure Monitor handler initialization."""
         handler = AzureMonitorHandler(
@@ -291,7 +345,7 @@ class TestAzureMonitorHandler:
         """Test Azure Monitor handler emit method."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_requests.post.return_value = mock_response
+        mock_requests.Session.return_value.post.return_value = mock_response
 
         handler = AzureMonitorHandler(
             workspace_id="test-workspace-id", workspace_key="test-workspace-key", log_type="TestLogs"
@@ -308,12 +362,13 @@ class TestAzureMonitorHandler:
         )
 
         handler.emit(record)
+        handler.flush()
 
         # Verify that POST request was made
-        mock_requests.post.assert_called_once()
+        mock_requests.Session.return_value.post.assert_called_once()
 
         # Check the call arguments
-        call_args = mock_requests.post.call_args
+        call_args = mock_requests.Session.return_value.post.call_args
         assert "test-workspace-id.ods.opinsights.azure.com" in call_args[0][0]
         assert call_args[1]["headers"]["Log-Type"] == "TestLogs"
 
@@ -322,7 +377,7 @@ class TestAzureMonitorHandler:
         """Test Azure Monitor handler emit with extra fields."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_requests.post.return_value = mock_response
+        mock_requests.Session.return_value.post.return_value = mock_response
 
         handler = AzureMonitorHandler(
             workspace_id="test-workspace-id", workspace_key="test-workspace-key", log_type="TestLogs"
@@ -343,23 +398,168 @@ class TestAzureMonitorHandler:
         record.request_id = "test-request-id"
 
         handler.emit(record)
+        handler.flush()
 
         # Verify that POST request was made
-        mock_requests.post.assert_called_once()
+        mock_requests.Session.return_value.post.assert_called_once()
 
         # Check that extra fields are included in the JSON data
-        call_args = mock_requests.post.call_args
+        call_args = mock_requests.Session.return_value.post.call_args
         json_data = json.loads(call_args[1]["data"])
         assert json_data[0]["custom_field"] == "custom_value"
         assert json_data[0]["request_id"] == "test-request-id"
 
+    @patch("flask_remote_logging.azure_extension.requests")
+    def test_emit_without_formatter_matches_default_format(self, mock_requests):
+        """Test that the unformatted fast path produces the same messages as format()."""
+        mock_post = mock_requests.Session.return_value.post
+        mock_post.return_value = Mock(status_code=200)
+
+        handler = AzureMonitorHandler(
+            workspace_id="test-workspace-id", workspace_key="test-workspace-key", log_type="TestLogs"
+        )
+        plain = logging.makeLogRecord({"name": "test.logger", "msg": "hello %s", "args": ("world",)})
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            failing = logging.makeLogRecord({"name": "test.logger", "msg": "failed", "exc_info": sys.exc_info()})
+
+        with patch.object(handler, "format", wraps=handler.format) as mock_format:
+            handler.emit(plain)
+            mock_format.assert_not_called()
+            handler.emit(failing)
+            mock_format.assert_called_once_with(failing)
+        handler.flush()
+
+        entries = json.loads(mock_post.call_args[1]["data"])
+        assert entries[0]["message"] == "hello world"
+        assert entries[1]["message"].startswith("failed\nTraceback")
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @patch("flask_remote_logging.azure_extension.requests")
+    def test_emit_keeps_native_extra_field_types(self, mock_requests, use_orjson):
+        """Test that JSON scalar extras keep their type and others are stringified."""
+        orjson = pytest.importorskip("orjson") if use_orjson else None
+        mock_post = mock_requests.Session.return_value.post
+        mock_post.return_value = Mock(status_code=200)
+
+        handler = AzureMonitorHandler(
+            workspace_id="test-workspace-id", workspace_key="test-workspace-key", log_type="TestLogs"
+        )
+        handler.setFormatter(logging.Formatter("formatted: %(message)s"))
+        record = logging.makeLogRecord(
+            {"name": "test.logger", "msg": "hello", "user_id": 42, "tags": ["a"], "obj": object()}
+        )
+
+        with patch("flask_remote_logging.azure_extension.orjson", orjson):
+            handler.emit(record)
+            handler.flush()
+
+        entry = json.loads(mock_post.call_args[1]["data"])[0]
+        assert entry["message"] == "formatted: hello"
+        assert entry["user_id"] == 42
+        assert entry["tags"] == "['a']"
+        assert isinstance(entry["obj"], str)
+        assert "asctime" not in entry
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @patch("flask_remote_logging.azure_extension.requests")
+    def test_emit_unencodable_extra_does_not_stop_delivery(self, mock_requests, use_orjson):
+        """Test that oversized ints and values whose str() raises cannot break a later flush."""
+        orjson = pytest.importorskip("orjson") if use_orjson else None
+        mock_post = mock_requests.Session.return_value.post
+        mock_post.return_value = Mock(status_code=200)
+
+        class Unprintable:
+            def __str__(self):
+                raise RuntimeError("working outside of request context")
+
+        handler = AzureMonitorHandler(
+            workspace_id="test-workspace-id", workspace_key="test-workspace-key", log_type="TestLogs"
+        )
+        handler._start_flush_thread = Mock()  # keep delivery on the test thread
+
+        with patch("flask_remote_logging.azure_extension.orjson", orjson), patch.object(handler, "handleError") as err:
+            handler.emit(logging.makeLogRecord({"name": "test.logger", "msg": "big", "trace": 2**128 + 1}))
+            handler.emit(logging.makeLogRecord({"name": "test.logger", "msg": "bad", "user": Unprintable()}))
+            handler.emit(logging.makeLogRecord({"name": "test.logger", "msg": "good"}))
+            handler.flush()
+
+        err.assert_called_once()
+        entries = json.loads(mock_post.call_args[1]["data"])
+        assert [entry["message"] for entry in entries] == ["big", "good"]
+        assert entries[0]["trace"] == str(2**128 + 1)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @patch("flask_remote_logging.azure_extension.requests")
+    def test_send_log_data_posts_utf8_bytes(self, mock_requests, use_orjson):
+        """Test that the payload is sent as UTF-8 bytes with or without orjson."""
+        orjson = pytest.importorskip("orjson") if use_orjson else None
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_requests.Session.return_value.post.return_value = mock_response
+
+        handler = AzureMonitorHandler(
+            workspace_id="test-workspace-id", workspace_key="test-workspace-key", log_type="TestLogs"
+        )
+
+        with patch("flask_remote_logging.azure_extension.orjson", orjson):
+            handler._send_log_data([{"message": "caf\u00e9"}])
+
+        data = mock_requests.Session.return_value.post.call_args[1]["data"]
+        assert isinstance(data, bytes)
+        assert json.loads(data) == [{"message": "caf\u00e9"}]
+
+    @patch("flask_remote_logging.azure_extension.requests")
+    def test_send_log_data_signs_request(self, mock_requests):
+        """Test that the SharedKey signature matches the Data Collector API scheme."""
+        mock_requests.Session.return_value.post.return_value = Mock(status_code=200)
+        key = base64.b64encode(b"secret-key").decode()
+
+        handler = AzureMonitorHandler(workspace_id="test-workspace-id", workspace_key=key, log_type="TestLogs")
+        handler._send_log_data([{"message": "hello"}])
+        handler._send_log_data([{"message": "again"}])
+
+        call_kwargs = mock_requests.Session.return_value.post.call_args[1]
+        headers = call_kwargs["headers"]
+        string_to_hash = (
+            f"POST\n{len(call_kwargs['data'])}\napplication/json\nx-ms-date:{headers['x-ms-date']}\n/api/logs"
+        )
+        expected = base64.b64encode(
+            hmac.new(b"secret-key", string_to_hash.encode("ascii"), hashlib.sha256).digest()
+        ).decode()
+        assert headers["Authorization"] == f"SharedKey test-workspace-id:{expected}"
+        assert handler._decoded_key == b"secret-key"
+
+    @pytest.mark.parametrize("compress,size,expect_gzip", [(True, 2000, True), (True, 10, False), (False, 2000, False)])
+    @patch("flask_remote_logging.azure_extension.requests")
+    def test_send_log_data_compression(self, mock_requests, compress, size, expect_gzip):
+        """Test that large payloads are gzipped only when compression is enabled."""
+        mock_post = mock_requests.Session.return_value.post
+        mock_post.return_value = Mock(status_code=200)
+
+        handler = AzureMonitorHandler(
+            workspace_id="test-workspace-id",
+            workspace_key="test-workspace-key",
+            log_type="TestLogs",
+            compress=compress,
+        )
+        handler._send_log_data([{"message": "x" * size}])
+
+        call_kwargs = mock_post.call_args[1]
+        body = call_kwargs["data"]
+        assert (call_kwargs["headers"].get("Content-Encoding") == "gzip") is expect_gzip
+        if expect_gzip:
+            body = gzip.decompress(body)
+        assert json.loads(body) == [{"message": "x" * size}]
+
     @patch("flask_remote_logging.azure_extension.requests")
     def test_azure_monitor_handler_emit_http_error(self, mock_requests):
         """Test Azure Monitor handler with HTTP error."""
         mock_response = Mock()
         mock_response.status_code = 400
         mock_response.text = "Bad Request"
-        mock_requests.post.return_value = mock_response
+        mock_requests.Session.return_value.post.return_value = mock_response
 
         handler = AzureMonitorHandler(
             workspace_id="test-workspace-id", workspace_key="test-workspace-key", log_type="TestLogs"
@@ -375,10 +575,150 @@ class TestAzureMonitorHandler:
             exc_info=None,
         )
 
-        # Should handle error gracefully (calls handleError)
-        with patch.object(handler, "handleError") as mock_handle_error:
-            handler.emit(record)
-            mock_handle_error.assert_called_once()
+        # Delivery errors are reported by the flush and never raised to the caller
+        handler.emit(record)
+        with patch("flask_remote_logging.azure_extension.traceback.print_exc") as mock_print_exc:
+            handler.flush()
+            mock_print_exc.assert_called_once()
+        mock_requests.Session.return_value.post.assert_called_once()
+
+    @patch("flask_remote_logging.azure_extension.requests")
+    def test_emit_batches_records_into_one_post(self, mock_requests):
+        """Test that buffered records are posted together in a single request."""
+        mock_requests.Session.return_value.post.return_value = Mock(status_code=200)
+
+        handler = AzureMonitorHandler(
+            workspace_id="test-workspace-id",
+            workspace_key="test-workspace-key",
+            log_type="TestLogs",
+            flush_interval=60,
+        )
+
+        for i in range(3):
+            handler.emit(logging.makeLogRecord({"name": "test.logger", "msg": f"message {i}"}))
+        mock_requests.Session.return_value.post.assert_not_called()
+
+        handler.flush()
+
+        mock_requests.Session.return_value.post.assert_called_once()
+        payload = json.loads(mock_requests.Session.return_value.post.call_args[1]["data"])
+        assert [entry["message"] for entry in payload] == ["message 0", "message 1", "message 2"]
+
+    @patch("flask_remote_logging.azure_extension.MAX_BATCH_BYTES", 600)
+    @patch("flask_remote_logging.azure_extension.requests")
+    def test_flush_splits_batches_by_size(self, mock_requests):
+        """Test that a flush splits the buffer into posts within the byte limit."""
+        mock_requests.Session.return_value.post.return_value = Mock(status_code=200)
+
+        handler = AzureMonitorHandler(
+            workspace_id="test-workspace-id",
+            workspace_key="test-workspace-key",
+            log_type="TestLogs",
+            flush_interval=60,
+        )
+
+        for i in range(3):
+            handler.emit(logging.makeLogRecord({"name": "test.logger", "msg": "x" * 200}))
+        handler.flush()
+
+        assert mock_requests.Session.return_value.post.call_count > 1
+        calls = mock_requests.Session.return_value.post.call_args_list
+        sent = [entry for call in calls for entry in json.loads(call[1]["data"])]
+        assert len(sent) == 3
+        assert all(len(call[1]["data"]) <= 600 for call in mock_requests.Session.return_value.post.call_args_list)
+
+    @patch("flask_remote_logging.azure_extension.requests")
+    def test_flush_drops_only_records_that_fail_to_encode(self, mock_requests):
+        """Test that a record that cannot be encoded is dropped without losing the rest of its batch."""
+        from flask_remote_logging.azure_extension import _AzureRecord
+
+        mock_post = mock_requests.Session.return_value.post
+        mock_post.return_value = Mock(status_code=200)
+
+        class Unprintable:
+            def __str__(self):
+                raise RuntimeError("cannot be printed")
+
+        handler = AzureMonitorHandler(
+            workspace_id="test-workspace-id", workspace_key="test-workspace-key", log_type="TestLogs"
+        )
+        handler._start_flush_thread = Mock()  # keep delivery on the test thread
+        handler.emit(logging.makeLogRecord({"name": "test.logger", "msg": "before"}))
+        handler._buffer.append(_AzureRecord(0.0, "INFO", "test", "bad", "m", None, 1, None, None, {"x": Unprintable()}))
+        handler.emit(logging.makeLogRecord({"name": "test.logger", "msg": "after"}))
+
+        with patch("flask_remote_logging.azure_extension.traceback.print_exc") as mock_print_exc:
+            handler.flush()
+
+        mock_print_exc.assert_called_once()
+        entries = json.loads(mock_post.call_args[1]["data"])
+        assert [entry["message"] for entry in entries] == ["before", "after"]
+        assert not handler._buffer
+
+    def test_requests_imported_lazily(self, monkeypatch):
+        """Test that requests is only imported on first access, not at module load."""
+        from flask_remote_logging import azure_extension
+
+        monkeypatch.delitem(vars(azure_extension), "requests", raising=False)
+        assert "requests" not in vars(azure_extension)
+
+        assert azure_extension._get_requests() is not None
+        assert "requests" in vars(azure_extension)
+
+    def test_session_is_reused_and_retries_transient_errors(self):
+        """Test that posts share one pooled session with a retrying adapter."""
+        handler = AzureMonitorHandler(
+            workspace_id="test-workspace-id", workspace_key="test-workspace-key", log_type="TestLogs"
+        )
+
+        session = handler.session
+
+        assert handler.session is session
+        adapter = session.get_adapter(handler.uri)
+        assert adapter.max_retries.total == 3
+        assert 429 in adapter.max_retries.status_forcelist
+        handler.close()
+
+    @patch("flask_remote_logging.azure_extension.requests")
+    def test_close_flushes_buffered_records(self, mock_requests):
+        """Test that closing the handler delivers any buffered records."""
+        mock_requests.Session.return_value.post.return_value = Mock(status_code=200)
+
+        handler = AzureMonitorHandler(
+            workspace_id="test-workspace-id",
+            workspace_key="test-workspace-key",
+            log_type="TestLogs",
+            flush_interval=60,
+        )
+        handler.emit(logging.makeLogRecord({"name": "test.logger", "msg": "last words"}))
+
+        handler.close()
+
+        mock_requests.Session.return_value.post.assert_called_once()
+        assert not handler._flush_thread.is_alive()
+
+    def test_reset_after_fork_restarts_flusher_in_child(self):
+        """Test that a forked worker gets a fresh flusher and session instead of the parent's."""
+        from flask_remote_logging.azure_extension import _reset_handler_after_fork
+
+        handler = AzureMonitorHandler(
+            workspace_id="test-workspace-id", workspace_key="test-workspace-key", log_type="TestLogs"
+        )
+        handler._start_flush_thread = Mock()
+        handler.emit(logging.makeLogRecord({"name": "test.logger", "msg": "buffered before fork"}))
+        handler._flush_thread = Mock()  # stands in for the parent's thread, which does not exist in a child
+        handler._session = Mock()
+        send_lock = handler._send_lock
+
+        _reset_handler_after_fork(weakref.ref(handler))
+
+        assert handler._flush_thread is None
+        assert handler._session is None
+        assert handler._send_lock is not send_lock
+        assert not handler._buffer
+        handler.emit(logging.makeLogRecord({"name": "test.logger", "msg": "logged in the worker"}))
+        assert handler._start_flush_thread.call_count == 2
+        handler._buffer.clear()
 
     def test_azure_monitor_handler_emit_without_requests(self):
         """Test Azure Monitor handler without requests library."""
@@ -8,6 +8,7 @@ from flask import Flask
 from pygelf import GelfTcpHandler
 
 from flask_remote_logging import GraylogExtension
+from flask_remote_logging.base_extension import DEFAULT_LOG_FORMAT
 from flask_remote_logging.context_filter import FlaskRemoteLoggingContextFilter
 
 
@@ -65,6 +66,14 @@ class TestGraylogExtension:
         assert isinstance(extension.context_filter, FlaskRemoteLoggingContextFilter)
         assert extension.log_formatter is not None
 
+    def test_default_formatter_shared_between_extensions(self):
+        """Test that extensions using the default format share one formatter."""
+        first = GraylogExtension(app=Flask("first"))
+        second = GraylogExtension(app=Flask("second"))
+
+        assert first.log_formatter is second.log_formatter
+        assert first.log_formatter._fmt == DEFAULT_LOG_FORMAT
+
     def test_init_app_with_existing_filter(self, app):
         """Test init_app with existing context filter."""
         custom_filter = Mock(spec=logging.Filter)
@@ -194,8 +203,57 @@ class TestGraylogExtension:
             mock_logger2.setLevel.assert_called_once_with(logging.INFO)
             mock_logger1.addHandler.assert_called_once()
             mock_logger2.addHandler.assert_called_once()
-            mock_logger1.addFilter.assert_called_once()
-            mock_logger2.addFilter.assert_called_once()
+            # The context filter is carried by the shared handler only
+            mock_logger1.addFilter.assert_not_called()
+            mock_logger2.addFilter.assert_not_called()
+
+    def test_context_filter_runs_once_per_additional_logger_record(self, app):
+        """Test that records from additional loggers pass through the context filter once."""
+        app.env = "development"
+        context_filter = Mock(spec=logging.Filter)
+        context_filter.filter.return_value = True
+        extension = GraylogExtension(app=app, additional_logs=["test.filter_once"], context_filter=context_filter)
+        additional_logger = logging.getLogger("test.filter_once")
+        extension._handler.emit = Mock()
+
+        try:
+            context_filter.filter.reset_mock()
+            additional_logger.info("filtered once")
+
+            context_filter.filter.assert_called_once()
+        finally:
+            additional_logger.handlers.clear()
+
+    def test_additional_logs_configured_once(self, app):
+        """Test that repeated configuration does not attach duplicate handlers."""
+        app.env = "development"
+        extension = GraylogExtension(app=app, additional_logs=["test.configured_once"])
+        additional_logger = logging.getLogger("test.configured_once")
+        handler_count = len(additional_logger.handlers)
+
+        try:
+            extension._configure_additional_loggers(logging.NullHandler())
+
+            assert len(additional_logger.handlers) == handler_count
+        finally:
+            additional_logger.handlers.clear()
+            additional_logger.filters.clear()
+
+    def test_configure_logger_uses_setup_handler(self, app):
+        """Test that _configure_logger attaches the handler created during setup."""
+        app.env = "development"
+        extension = GraylogExtension(app=app)
+        other_logger = logging.getLogger("test.configure_logger")
+
+        try:
+            extension._configure_logger(other_logger, logging.WARNING)
+
+            assert extension._handler is not None
+            assert extension._handler in other_logger.handlers
+            assert other_logger.level == logging.WARNING
+        finally:
+            other_logger.handlers.clear()
+            other_logger.filters.clear()
 
     def test_setup_logging_without_context_filter(self, app, mock_logger):
         """Test logging setup without context filter."""
@@ -2,8 +2,12 @@
 Tests for IBM Cloud Logs Extension
 """
 
+import gzip
 import json
 import logging
+import sys
+import threading
+import weakref
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -29,6 +33,14 @@ class TestIBMLogExtension:
             }
         )
 
+    def teardown_method(self):
+        """Detach and close the handlers the extension installed, discarding any buffered lines."""
+        for handler in list(self.app.logger.handlers):
+            if isinstance(handler, IBMCloudLogHandler):
+                self.app.logger.removeHandler(handler)
+                handler._buffer.clear()
+                handler.close()
+
     def test_init_without_app(self):
         """Test extension initialization without Flask app."""
         extension = IBMLogExtension()
@@ -57,6 +69,42 @@ class TestIBMLogExtension:
         assert config["IBM_HOSTNAME"] == "test-host"
         assert config["IBM_APP_NAME"] == "test-app"
 
+    def test_get_config_from_app_reads_environment_once(self, monkeypatch):
+        """Test that environment fallbacks are read once and cached."""
+        from flask_remote_logging.ibm_extension import _ibm_environment
+
+        _ibm_environment.cache_clear()
+        monkeypatch.setenv("IBM_URL", "https://env.example.com/ingest")
+
+        extension = IBMLogExtension()
+        extension.app = Flask(__name__)
+        try:
+            assert extension._get_config_from_app()["IBM_URL"] == "https://env.example.com/ingest"
+
+            monkeypatch.setenv("IBM_URL", "https://changed.example.com/ingest")
+            assert extension._get_config_from_app()["IBM_URL"] == "https://env.example.com/ingest"
+
+            # App config still takes precedence over the environment
+            extension.app.config["IBM_URL"] = "https://app.example.com/ingest"
+            assert extension._get_config_from_app()["IBM_URL"] == "https://app.example.com/ingest"
+        finally:
+            _ibm_environment.cache_clear()
+
+    @patch("flask_remote_logging.ibm_extension.requests")
+    def test_create_log_handler_uses_batching_config(self, mock_requests):
+        """Test that the batching and timeout settings are passed to the handler."""
+        self.app.config.update(
+            {"IBM_BATCH_SIZE": "25", "IBM_FLUSH_INTERVAL": "2.5", "IBM_QUEUE_MAXSIZE": "500", "IBM_TIMEOUT": "5"}
+        )
+        extension = IBMLogExtension(self.app)
+
+        handler = extension._create_log_handler()
+
+        assert handler.batch_size == 25
+        assert handler.flush_interval == 2.5
+        assert handler._buffer.maxlen == 500
+        assert handler.timeout == 5
+
     def test_get_config_without_app(self):
         """Test configuration extraction without Flask app."""
         extension = IBMLogExtension()
@@ -123,6 +171,23 @@ class TestIBMLogExtension:
             logger.setLevel.assert_called_with(logging.INFO)
             logger.addHandler.assert_called()
 
+    @patch("flask_remote_logging.ibm_extension.requests")
+    def test_configure_logger_reuses_handler_once_per_logger(self, mock_requests):
+        """Test that repeat calls neither re-add nor re-create the handler."""
+        extension = IBMLogExtension(self.app)
+        extension.ingestion_key = "test-key"
+        first, second = logging.getLogger("test_ibm_configure_first"), logging.getLogger("test_ibm_configure_second")
+
+        try:
+            for logger in (first, second, first):
+                extension._configure_logger(logger, logging.INFO)
+
+            assert len(first.handlers) == 1
+            assert second.handlers == first.handlers
+        finally:
+            for logger in (first, second):
+                logger.handlers.clear()
+
     @patch("flask_remote_logging.ibm_extension.requests")
     def test_configure_logger_no_key(self, mock_requests):
         """Test logger configuration without ingestion key."""
@@ -144,6 +209,11 @@ class TestIBMCloudLogHandler:
         """Set up test fixtures."""
         self.handler = IBMCloudLogHandler(ingestion_key="test-key", hostname="test-host", app_name="test-app")
 
+    def teardown_method(self):
+        """Discard buffered lines and close the handler so nothing is posted at interpreter exit."""
+        self.handler._buffer.clear()
+        self.handler.close()
+
     def test_init(self):
         """Test handler initialization."""
         assert self.handler.ingestion_key == "test-key"
@@ -157,6 +227,19 @@ class TestIBMCloudLogHandler:
         assert handler.app_name == "flask-app"
         assert handler.env == "development"
 
+    def test_default_hostname_is_looked_up_once(self):
+        """Test that handlers share one socket.gethostname() lookup."""
+        from flask_remote_logging.ibm_extension import _default_hostname
+
+        _default_hostname.cache_clear()
+        try:
+            with patch("flask_remote_logging.ibm_extension.socket.gethostname", return_value="cached-host") as mock_get:
+                handlers = [IBMCloudLogHandler("test-key") for _ in range(3)]
+            assert [handler.hostname for handler in handlers] == ["cached-host"] * 3
+            mock_get.assert_called_once()
+        finally:
+            _default_hostname.cache_clear()
+
     def test_map_log_level(self):
         """Test log level mapping."""
         assert self.handler._map_log_level("DEBUG") == "Debug"
@@ -166,12 +249,42 @@ class TestIBMCloudLogHandler:
         assert self.handler._map_log_level("CRITICAL") == "Fatal"
         assert self.handler._map_log_level("UNKNOWN") == "Info"
 
+    @pytest.mark.parametrize(
+        "levelno,expected",
+        [(logging.DEBUG, "Debug"), (logging.WARNING, "Warn"), (logging.CRITICAL, "Fatal"), (25, "Info")],
+    )
+    def test_emit_maps_level_from_levelno(self, levelno, expected):
+        """Test that the line level is derived from the record's numeric level."""
+        self.handler._start_flush_thread = Mock()  # keep the line in the buffer
+        self.handler._post_batch = Mock()
+        record = logging.makeLogRecord({"name": "test", "msg": "message", "levelno": levelno, "levelname": "CUSTOM"})
+
+        self.handler.emit(record)
+
+        assert self.handler._buffer[-1]["level"] == expected
+
+    @pytest.mark.parametrize("include_meta,index_meta", [(True, False), (True, True), (False, True)])
+    def test_emit_meta_options(self, include_meta, index_meta):
+        """Test that meta is only built when included and only flagged for indexing when requested."""
+        self.handler.include_meta = include_meta
+        self.handler.index_meta = index_meta
+        self.handler._start_flush_thread = Mock()  # keep the line in the buffer
+        self.handler._post_batch = Mock()
+
+        self.handler.emit(logging.makeLogRecord({"name": "test", "msg": "message", "user_id": 7}))
+
+        line = self.handler._buffer[-1]
+        assert ("meta" in line) is include_meta
+        if include_meta:
+            assert line["meta"]["user_id"] == 7
+        assert line.get("indexMeta", False) is (include_meta and index_meta)
+
     @patch("flask_remote_logging.ibm_extension.requests")
     def test_emit_success(self, mock_requests):
         """Test successful log emission."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_requests.post.return_value = mock_response
+        mock_requests.Session.return_value.post.return_value = mock_response
 
         # Create a log record
         record = logging.LogRecord(
@@ -180,16 +293,18 @@ class TestIBMCloudLogHandler:
         record.created = 1234567890.123
 
         self.handler.emit(record)
+        mock_requests.Session.return_value.post.assert_not_called()
+        self.handler.flush()
 
         # Verify the request was made
-        mock_requests.post.assert_called_once()
-        call_args = mock_requests.post.call_args
+        mock_requests.Session.return_value.post.assert_called_once()
+        call_args = mock_requests.Session.return_value.post.call_args
 
         # Check authentication
-        assert call_args[1]["auth"] == ("test-key", "")
+        assert mock_requests.Session.return_value.auth == ("test-key", "")
 
         # Check payload structure
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         assert "lines" in payload
         assert len(payload["lines"]) == 1
 
@@ -203,7 +318,7 @@ class TestIBMCloudLogHandler:
         """Test log emission with extra fields."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_requests.post.return_value = mock_response
+        mock_requests.Session.return_value.post.return_value = mock_response
 
         # Create a log record with extra fields
         record = logging.LogRecord(
@@ -214,33 +329,254 @@ class TestIBMCloudLogHandler:
         record.user_id = 123
 
         self.handler.emit(record)
+        self.handler.flush()
 
         # Check that extra fields are in metadata
-        call_args = mock_requests.post.call_args
-        payload = call_args[1]["json"]
+        call_args = mock_requests.Session.return_value.post.call_args
+        payload = json.loads(call_args[1]["data"])
         log_line = payload["lines"][0]
 
         assert "meta" in log_line
         assert log_line["meta"]["custom_field"] == "custom_value"
         assert log_line["meta"]["user_id"] == 123
 
+    @patch("flask_remote_logging.ibm_extension.requests")
+    def test_emit_without_formatter_skips_format(self, mock_requests):
+        """Test that plain records use getMessage() while formatted paths still apply."""
+        mock_post = mock_requests.Session.return_value.post
+        mock_post.return_value = Mock(status_code=200)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            failing = logging.makeLogRecord({"name": "test", "msg": "failed", "exc_info": sys.exc_info()})
+
+        with patch.object(self.handler, "format", wraps=self.handler.format) as mock_format:
+            self.handler.emit(logging.makeLogRecord({"name": "test", "msg": "hello %s", "args": ("world",)}))
+            mock_format.assert_not_called()
+            self.handler.emit(failing)
+            mock_format.assert_called_once_with(failing)
+        self.handler.flush()
+
+        lines = json.loads(mock_post.call_args[1]["data"])["lines"]
+        assert lines[0]["line"] == "hello world"
+        assert lines[1]["line"].startswith("failed\nTraceback")
+
+    @patch("flask_remote_logging.ibm_extension.requests")
+    def test_emit_stringifies_unencodable_extra_fields(self, mock_requests):
+        """Test that extra fields the JSON encoder cannot handle are sent as strings."""
+        mock_requests.Session.return_value.post.return_value = Mock(status_code=200)
+        marker = object()
+        record = logging.makeLogRecord(
+            {"name": "test", "msg": "test message", "tags": ["a", 1], "obj": marker, "nested": {"obj": marker}}
+        )
+
+        self.handler.emit(record)
+        self.handler.flush()
+
+        call_args = mock_requests.Session.return_value.post.call_args
+        meta = json.loads(call_args[1]["data"])["lines"][0]["meta"]
+        assert meta["tags"] == ["a", 1]
+        assert meta["obj"] == str(marker)
+        assert meta["nested"] == str({"obj": marker})
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @patch("flask_remote_logging.ibm_extension.requests")
+    def test_oversized_int_extra_does_not_lose_batch(self, mock_requests, use_orjson):
+        """Test that integers wider than 64 bits are delivered alongside the rest of their batch."""
+        orjson = pytest.importorskip("orjson") if use_orjson else None
+        mock_post = mock_requests.Session.return_value.post
+        mock_post.return_value = Mock(status_code=200)
+        self.handler._start_flush_thread = Mock()  # keep delivery on the test thread
+        big = 2**128 + 1
+
+        with patch("flask_remote_logging.ibm_extension.orjson", orjson):
+            self.handler.emit(logging.makeLogRecord({"name": "test", "msg": "good1"}))
+            self.handler.emit(logging.makeLogRecord({"name": "test", "msg": "bad", "trace": big, "ids": [big]}))
+            self.handler.emit(logging.makeLogRecord({"name": "test", "msg": "good2"}))
+            self.handler.flush()
+
+        mock_post.assert_called_once()
+        lines = json.loads(mock_post.call_args[1]["data"])["lines"]
+        assert [line["line"] for line in lines] == ["good1", "bad", "good2"]
+        assert lines[1]["meta"]["trace"] == str(big)
+        assert lines[1]["meta"]["ids"] in ([big], [str(big)])
+
     @patch("flask_remote_logging.ibm_extension.requests")
     def test_emit_error_response(self, mock_requests):
         """Test log emission with error response."""
         mock_response = Mock()
         mock_response.status_code = 400
         mock_response.text = "Bad Request"
-        mock_requests.post.return_value = mock_response
+        mock_requests.Session.return_value.post.return_value = mock_response
 
         record = logging.LogRecord(
             name="test", level=logging.INFO, pathname="test.py", lineno=10, msg="test message", args=(), exc_info=None
         )
         record.created = 1234567890.123
 
-        # Should not raise exception, but call handleError
-        with patch.object(self.handler, "handleError") as mock_handle_error:
-            self.handler.emit(record)
-            mock_handle_error.assert_called_once()
+        # Delivery errors are reported by the flush and never raised to the caller
+        self.handler.emit(record)
+        with patch("flask_remote_logging.ibm_extension.traceback.print_exc") as mock_print_exc:
+            self.handler.flush()
+            mock_print_exc.assert_called_once()
+        mock_requests.Session.return_value.post.assert_called_once()
+
+    @patch("flask_remote_logging.ibm_extension.requests")
+    def test_flush_posts_in_batches(self, mock_requests):
+        """Test that buffered lines are posted in batches of at most batch_size."""
+        mock_requests.Session.return_value.post.return_value = Mock(status_code=200)
+        handler = IBMCloudLogHandler(ingestion_key="test-key", batch_size=3, flush_interval=60, max_in_flight=1)
+        handler._start_flush_thread = Mock()  # keep delivery on the test thread
+
+        for i in range(4):
+            handler.emit(logging.makeLogRecord({"name": "test", "msg": f"message {i}"}))
+        mock_requests.Session.return_value.post.assert_not_called()
+
+        handler.flush()
+
+        calls = mock_requests.Session.return_value.post.call_args_list
+        batches = [json.loads(call[1]["data"])["lines"] for call in calls]
+        assert [[line["line"] for line in lines] for lines in batches] == [
+            ["message 0", "message 1", "message 2"],
+            ["message 3"],
+        ]
+
+    @patch("flask_remote_logging.ibm_extension.requests")
+    def test_flush_posts_batches_concurrently(self, mock_requests):
+        """Test that a flush keeps up to max_in_flight batches in flight at once."""
+        barrier = threading.Barrier(2, timeout=5)
+        mock_post = mock_requests.Session.return_value.post
+        mock_post.side_effect = lambda *args, **kwargs: barrier.wait() is not None and Mock(status_code=200)
+        handler = IBMCloudLogHandler(ingestion_key="test-key", batch_size=2, flush_interval=60, max_in_flight=2)
+        handler._start_flush_thread = Mock()  # keep delivery on the test thread
+
+        for i in range(4):
+            handler.emit(logging.makeLogRecord({"name": "test", "msg": f"message {i}"}))
+        handler.flush()  # both posts must be waiting at the barrier together to return
+
+        batches = [json.loads(call[1]["data"])["lines"] for call in mock_post.call_args_list]
+        assert sorted(line["line"] for lines in batches for line in lines) == [f"message {i}" for i in range(4)]
+        assert not barrier.broken
+        mock_requests.Session.assert_called_once()  # the concurrent senders share one session
+        handler.close()
+        assert handler._executor is None
+
+    @patch("flask_remote_logging.ibm_extension.requests")
+    def test_full_buffer_drops_oldest_and_reports_count(self, mock_requests):
+        """Test that lines evicted from a full buffer are counted and reported."""
+        mock_post = mock_requests.Session.return_value.post
+        mock_post.return_value = Mock(status_code=200)
+        handler = IBMCloudLogHandler(ingestion_key="test-key", batch_size=10, flush_interval=60, max_buffer_size=2)
+        handler._start_flush_thread = Mock()  # keep delivery on the test thread
+
+        for i in range(5):
+            handler.emit(logging.makeLogRecord({"name": "test", "msg": f"message {i}"}))
+        handler.flush()
+
+        lines = json.loads(mock_post.call_args[1]["data"])["lines"]
+        assert [line["line"] for line in lines[:2]] == ["message 3", "message 4"]
+        assert lines[2]["level"] == "Warn"
+        assert lines[2]["meta"]["dropped"] == 3
+        assert handler._dropped == 0
+
+    @patch("flask_remote_logging.ibm_extension.requests")
+    def test_full_buffer_blocks_until_flushed(self, mock_requests):
+        """Test that the block policy waits for the flusher instead of dropping lines."""
+        mock_post = mock_requests.Session.return_value.post
+        mock_post.return_value = Mock(status_code=200)
+        handler = IBMCloudLogHandler(
+            ingestion_key="test-key",
+            batch_size=10,
+            flush_interval=60,
+            max_buffer_size=2,
+            block_when_full=True,
+            compress=False,
+        )
+
+        for i in range(5):
+            handler.emit(logging.makeLogRecord({"name": "test", "msg": f"message {i}"}))
+        handler.close()
+
+        sent = [line["line"] for call in mock_post.call_args_list for line in json.loads(call[1]["data"])["lines"]]
+        assert sorted(sent) == [f"message {i}" for i in range(5)]
+
+    def test_emit_after_close_is_a_no_op(self):
+        """Test that records emitted after close are dropped without being buffered."""
+        self.handler.close()
+
+        self.handler.handle(logging.makeLogRecord({"name": "test", "msg": "too late"}))
+
+        assert not self.handler._buffer
+        assert self.handler._flush_thread is None
+
+    def test_reset_after_fork_restarts_flusher_in_child(self):
+        """Test that a forked worker gets a fresh flusher, sender pool and session instead of the parent's."""
+        from flask_remote_logging.ibm_extension import _reset_handler_after_fork
+
+        self.handler._start_flush_thread = Mock()
+        self.handler.emit(logging.makeLogRecord({"name": "test", "msg": "buffered before fork"}))
+        self.handler._flush_thread = Mock()  # stands in for the parent's thread, which does not exist in a child
+        self.handler._executor = Mock()
+        self.handler._session = Mock()
+        send_lock = self.handler._send_lock
+
+        _reset_handler_after_fork(weakref.ref(self.handler))
+
+        assert self.handler._flush_thread is None
+        assert self.handler._executor is None
+        assert self.handler._session is None
+        assert self.handler._send_lock is not send_lock
+        assert not self.handler._buffer
+        self.handler.emit(logging.makeLogRecord({"name": "test", "msg": "logged in the worker"}))
+        assert self.handler._start_flush_thread.call_count == 2
+        self.handler._buffer.clear()
+
+    @patch("flask_remote_logging.ibm_extension.requests")
+    def test_background_thread_posts_full_batch(self, mock_requests):
+        """Test that the flush thread posts as soon as a batch is full."""
+        posted = threading.Event()
+        mock_post = mock_requests.Session.return_value.post
+        mock_post.side_effect = lambda *args, **kwargs: posted.set() or Mock(status_code=200)
+        handler = IBMCloudLogHandler(ingestion_key="test-key", batch_size=2, flush_interval=60)
+
+        handler.emit(logging.makeLogRecord({"name": "test", "msg": "first"}))
+        handler.emit(logging.makeLogRecord({"name": "test", "msg": "second"}))
+
+        assert posted.wait(timeout=5)
+        handler.close()
+        assert not handler._flush_thread.is_alive()
+        sent = [line["line"] for call in mock_post.call_args_list for line in json.loads(call[1]["data"])["lines"]]
+        assert sent == ["first", "second"]
+
+    @pytest.mark.parametrize("compress,size,expect_gzip", [(True, 2000, True), (True, 10, False), (False, 2000, False)])
+    @patch("flask_remote_logging.ibm_extension.requests")
+    def test_send_log_data_compression(self, mock_requests, compress, size, expect_gzip):
+        """Test that large payloads are gzipped only when compression is enabled."""
+        mock_post = mock_requests.Session.return_value.post
+        mock_post.return_value = Mock(status_code=200)
+        handler = IBMCloudLogHandler(ingestion_key="test-key", compress=compress)
+        payload = {"lines": [{"line": "x" * size}]}
+
+        handler._send_log_data(payload)
+
+        call_kwargs = mock_post.call_args[1]
+        body = call_kwargs["data"]
+        assert ((call_kwargs["headers"] or {}).get("Content-Encoding") == "gzip") is expect_gzip
+        if expect_gzip:
+            body = gzip.decompress(body)
+        assert json.loads(body) == payload
+
+    def test_session_is_reused_with_credentials_and_retries(self):
+        """Test that posts share one pooled, authenticated session with a retrying adapter."""
+        session = self.handler.session
+
+        assert self.handler.session is session
+        assert session.auth == ("test-key", "")
+        assert session.headers["Content-Type"] == "application/json"
+        adapter = session.get_adapter(self.handler.url)
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        self.handler.close()
 
     @patch("flask_remote_logging.ibm_extension.requests", None)
     def test_send_log_data_without_requests(self):
@@ -255,25 +591,25 @@ class TestIBMCloudLogHandler:
         """Test successful log data sending."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_requests.post.return_value = mock_response
+        mock_requests.Session.return_value.post.return_value = mock_response
 
         payload = {"lines": [{"line": "test", "app": "test-app"}]}
         self.handler._send_log_data(payload)
 
-        mock_requests.post.assert_called_once()
-        call_args = mock_requests.post.call_args
+        mock_requests.Session.return_value.post.assert_called_once()
+        call_args = mock_requests.Session.return_value.post.call_args
 
         # Check URL and auth
         assert call_args[0][0] == "https://logs.us-south.logging.cloud.ibm.com/logs/ingest"
-        assert call_args[1]["auth"] == ("test-key", "")
-        assert call_args[1]["json"] == payload
+        assert mock_requests.Session.return_value.auth == ("test-key", "")
+        assert json.loads(call_args[1]["data"]) == payload
 
     @patch("flask_remote_logging.ibm_extension.requests")
     def test_send_log_data_with_optional_params(self, mock_requests):
         """Test log data sending with optional parameters."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_requests.post.return_value = mock_response
+        mock_requests.Session.return_value.post.return_value = mock_response
 
         handler = IBMCloudLogHandler(
             ingestion_key="test-key",
@@ -286,7 +622,7 @@ class TestIBMCloudLogHandler:
         payload = {"lines": []}
         handler._send_log_data(payload)
 
-        call_args = mock_requests.post.call_args
+        call_args = mock_requests.Session.return_value.post.call_args
         params = call_args[1]["params"]
 
         assert params["hostname"] == "test-host"
@@ -300,7 +636,11 @@ class TestIBMCloudLogHandler:
         logger = logging.getLogger("test_ibm")
         logger.addHandler(self.handler)
         logger.setLevel(logging.INFO)
-
-        with patch.object(self.handler, "emit") as mock_emit:
-            logger.info("Test message")
-            mock_emit.assert_called_once()
+        self.handler._post_batch = Mock()
+
+        try:
+            with patch.object(self.handler, "emit") as mock_emit:
+                logger.info("Test message")
+                mock_emit.assert_called_once()
+        finally:
+            logger.removeHandler(self.handler)
@@ -7,6 +7,9 @@ ensuring proper functionality for OCI Logging integration.
 
 import json
 import logging
+import sys
+import threading
+import weakref
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -18,6 +21,19 @@ from flask_remote_logging.oci_extension import OCILogExtension, OCILogHandler
 class TestOCILogExtension:
     """Test suite for OCILogExtension class."""
 
+    @pytest.fixture(autouse=True)
+    def close_installed_handlers(self):
+        """Detach and close the handlers a test's extension installed, discarding any buffered entries."""
+        yield
+        loggers = [logging.getLogger()]
+        loggers += [obj for obj in logging.Logger.manager.loggerDict.values() if isinstance(obj, logging.Logger)]
+        for logger in loggers:
+            for handler in list(logger.handlers):
+                if isinstance(handler, OCILogHandler):
+                    logger.removeHandler(handler)
+                    handler._buffer.clear()
+                    handler.close()
+
     def test_init_without_app(self):
         """Test extension initialization without Flask app."""
         extension = OCILogExtension()
@@ -45,6 +61,18 @@ class TestOCILogExtension:
 
         assert extension.app == app
 
+    def test_init_skips_backend_when_setup_skipped(self):
+        """Test that the OCI backend is not initialized when setup will be skipped."""
+        app = Flask(__name__)
+        app.config.update({"OCI_ENVIRONMENT": "development"})
+
+        with patch("flask_remote_logging.oci_extension.oci") as mock_oci:
+            extension = OCILogExtension(app=app)
+
+        mock_oci.config.from_file.assert_not_called()
+        assert extension.logging_client is None
+        assert extension.context_filter is not None
+
     def test_init_with_parameters(self):
         """Test extension initialization with custom parameters."""
         extension = OCILogExtension(log_level=logging.DEBUG, additional_logs=["custom.logger"], enable_middleware=False)
@@ -118,6 +146,27 @@ class TestOCILogExtension:
         assert config["OCI_LOG_ID"] == "ocid1.log.oc1..."
         assert config["OCI_APP_NAME"] == "custom-app"
 
+    def test_get_config_from_app_reads_environment_once(self, monkeypatch):
+        """Test that environment fallbacks are read once and cached."""
+        from flask_remote_logging.oci_extension import _oci_environment
+
+        _oci_environment.cache_clear()
+        monkeypatch.setenv("OCI_LOG_ID", "ocid1.log.env")
+
+        extension = OCILogExtension()
+        extension.app = Flask(__name__)
+        try:
+            assert extension._get_config_from_app()["OCI_LOG_ID"] == "ocid1.log.env"
+
+            monkeypatch.setenv("OCI_LOG_ID", "ocid1.log.changed")
+            assert extension._get_config_from_app()["OCI_LOG_ID"] == "ocid1.log.env"
+
+            # App config still takes precedence over the environment
+            extension.app.config["OCI_LOG_ID"] = "ocid1.log.app"
+            assert extension._get_config_from_app()["OCI_LOG_ID"] == "ocid1.log.app"
+        finally:
+            _oci_environment.cache_clear()
+
     def test_setup_logging_without_app(self):
         """Test logging setup without Flask app."""
         extension = OCILogExtension()
@@ -171,14 +220,30 @@ class TestOCILogExtension:
         mock_config = {"region": "us-ashburn-1"}
         mock_oci.config.from_file.return_value = mock_config
         mock_client = Mock()
-        mock_oci.logging.LoggingManagementClient.return_value = mock_client
+        mock_oci.loggingingestion.LoggingClient.return_value = mock_client
 
         extension._init_backend()
 
         assert extension.logging_client == mock_client
+        mock_oci.loggingingestion.LoggingClient.assert_called_once_with(
+            mock_config, retry_strategy=mock_oci.retry.DEFAULT_RETRY_STRATEGY
+        )
         assert extension.log_group_id == "ocid1.loggroup.oc1..."
         assert extension.log_id == "ocid1.log.oc1..."
 
+    @patch("flask_remote_logging.oci_extension.oci")
+    def test_init_backend_parses_config_file_once(self, mock_oci):
+        """Test that repeated backend initialization reuses the parsed OCI config."""
+        mock_oci.config.from_file.return_value = {"region": "us-ashburn-1"}
+        extensions = [OCILogExtension() for _ in range(3)]
+
+        for extension in extensions:
+            extension.config = {"OCI_CONFIG_FILE": "~/.oci/config", "OCI_PROFILE": "DEFAULT"}
+            extension._init_backend()
+
+        mock_oci.config.from_file.assert_called_once_with("~/.oci/config", "DEFAULT")
+        assert mock_oci.loggingingestion.LoggingClient.call_count == 3
+
     @patch("flask_remote_logging.oci_extension.oci")
     def test_init_backend_without_oci(self, mock_oci):
         """Test OCI backend initialization with OCI SDK errors."""
@@ -187,7 +252,7 @@ class TestOCILogExtension:
         extension.app = app
         extension.config = {"OCI_CONFIG_FILE": "~/.oci/config"}
 
-        mock_oci.config.from_file.side_effect = Exception("Config error")
+        mock_oci.config.from_file.side_effect = ValueError("Config error")
 
         extension._init_backend()
 
@@ -223,6 +288,20 @@ class TestOCILogExtension:
             assert handler == mock_handler
             mock_handler_class.assert_called_once()
 
+    def test_create_log_handler_uses_batching_config(self):
+        """Test that the batching settings are passed to the handler."""
+        extension = OCILogExtension()
+        extension.logging_client = Mock()
+        extension.log_group_id = "ocid1.loggroup.oc1..."
+        extension.log_id = "ocid1.log.oc1..."
+        extension.config = {"OCI_BATCH_SIZE": "25", "OCI_FLUSH_INTERVAL": "0.2", "OCI_QUEUE_MAXSIZE": "500"}
+
+        handler = extension._create_log_handler()
+
+        assert handler.batch_size == 25
+        assert handler.flush_interval == 0.2
+        assert handler._buffer.maxlen == 500
+
     def test_create_log_handler_without_client(self):
         """Test log handler creation without OCI client (fallback to stream)."""
         extension = OCILogExtension()
@@ -323,9 +402,13 @@ class TestOCILogHandler:
             name="test", level=logging.INFO, pathname="", lineno=0, msg="Test message", args=(), exc_info=None
         )
 
-        with patch.object(handler, "_send_to_oci_logging") as mock_send:
+        handler._start_flush_thread = Mock()  # keep delivery on the test thread
+        with patch.object(handler, "_send_log_entries") as mock_send:
             handler.emit(record)
+            mock_send.assert_not_called()
+            handler.flush()
             mock_send.assert_called_once()
+            assert mock_send.call_args[0][0][0]["data"]["message"] == "Test message"
 
     def test_emit_error_response(self):
         """Test log emission with OCI API error."""
@@ -342,10 +425,13 @@ class TestOCILogHandler:
             name="test", level=logging.INFO, pathname="", lineno=0, msg="Test message", args=(), exc_info=None
         )
 
-        with patch.object(handler, "_send_to_oci_logging", side_effect=Exception("API Error")):
-            with patch.object(handler, "handleError") as mock_handle_error:
-                handler.emit(record)
-                mock_handle_error.assert_called_once_with(record)
+        # Delivery errors are reported by the flush and never raised to the caller
+        handler._start_flush_thread = Mock()  # keep delivery on the test thread
+        with patch.object(handler, "_send_log_entries", side_effect=Exception("API Error")):
+            handler.emit(record)
+            with patch("flask_remote_logging.oci_extension.traceback.print_exc") as mock_print_exc:
+                handler.flush()
+                mock_print_exc.assert_called_once()
 
     @patch("flask_remote_logging.oci_extension.oci", None)
     def test_send_log_data_without_oci(self):
@@ -398,6 +484,188 @@ class TestOCILogHandler:
             logger.setLevel(logging.INFO)
 
             # Test that logging works
-            with patch.object(handler, "_send_to_oci_logging") as mock_send:
+            with patch.object(handler, "_send_log_entries") as mock_send:
                 logger.info("Test log message")
+                handler.close()
                 mock_send.assert_called_once()
+            logger.removeHandler(handler)
+
+    def test_emit_without_formatter_skips_format(self):
+        """Test that plain records use getMessage() while formatted paths still apply."""
+        handler = OCILogHandler(logging_client=Mock(), log_group_id="ocid1.loggroup.oc1...", log_id="ocid1.log.oc1...")
+        handler._start_flush_thread = Mock()  # keep the entries in the buffer
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            failing = logging.makeLogRecord({"name": "test", "msg": "failed", "exc_info": sys.exc_info()})
+
+        with patch.object(handler, "format", wraps=handler.format) as mock_format:
+            handler.emit(logging.makeLogRecord({"name": "test", "msg": "hello %s", "args": ("world",)}))
+            mock_format.assert_not_called()
+            handler.emit(failing)
+            mock_format.assert_called_once_with(failing)
+
+        assert handler._buffer[0]["data"]["message"] == "hello world"
+        assert handler._buffer[1]["data"]["message"].startswith("failed\nTraceback")
+        handler._buffer.clear()
+        handler.close()
+
+    @pytest.mark.parametrize(
+        "created,expected",
+        [
+            (0.5, "1970-01-01T00:00:00.500000Z"),
+            (1704067199.25, "2023-12-31T23:59:59.250000Z"),
+            (1704067200.000123, "2024-01-01T00:00:00.000123Z"),
+        ],
+    )
+    def test_format_timestamp_is_utc(self, created, expected):
+        """Test that entry timestamps are UTC regardless of the local time zone."""
+        from flask_remote_logging.oci_extension import _format_timestamp
+
+        assert _format_timestamp(created) == expected
+
+    def test_emit_includes_extra_fields(self):
+        """Test that non-standard record attributes are sent as JSON-safe extra fields."""
+        handler = OCILogHandler(logging_client=Mock(), log_group_id="ocid1.loggroup.oc1...", log_id="ocid1.log.oc1...")
+        handler._start_flush_thread = Mock()  # keep the entry in the buffer
+        record = logging.makeLogRecord(
+            {"name": "test", "msg": "message", "request_id": "abc", "user_id": 7, "path": None, "_private": 1}
+        )
+        record.user = object()
+
+        handler.emit(record)
+
+        extra = handler._buffer[-1]["data"]["extra"]
+        assert extra == {"request_id": "abc", "user_id": 7, "user": str(record.user)}
+        handler._buffer.clear()
+        handler.close()
+
+    @patch("flask_remote_logging.oci_extension.oci")
+    def test_flush_sends_batches_in_one_call_each(self, mock_oci):
+        """Test that buffered entries are sent with one put_logs call per batch."""
+        mock_client = Mock()
+        handler = OCILogHandler(
+            logging_client=mock_client,
+            log_group_id="ocid1.loggroup.oc1...",
+            log_id="ocid1.log.oc1...",
+            batch_size=3,
+            flush_interval=60,
+        )
+        handler._start_flush_thread = Mock()  # keep delivery on the test thread
+
+        for i in range(4):
+            handler.emit(logging.makeLogRecord({"name": "test", "msg": f"message {i}"}))
+        mock_client.put_logs.assert_not_called()
+
+        handler.flush()
+
+        assert mock_client.put_logs.call_count == 2
+        entry_calls = mock_oci.loggingingestion.models.LogEntry.call_args_list
+        assert [call.kwargs["data"]["message"] for call in entry_calls] == [f"message {i}" for i in range(4)]
+        assert len({call.kwargs["id"] for call in entry_calls}) == 4
+
+    @patch("flask_remote_logging.oci_extension.oci")
+    def test_emit_batches_multiple_records(self, mock_oci):
+        """Test that many records logged between flushes cost a single put_logs call."""
+        mock_client = Mock()
+        handler = OCILogHandler(
+            logging_client=mock_client, log_group_id="ocid1.loggroup.oc1...", log_id="ocid1.log.oc1..."
+        )
+        handler._start_flush_thread = Mock()  # keep delivery on the test thread
+
+        for i in range(50):
+            handler.emit(logging.makeLogRecord({"name": "test", "msg": f"message {i}"}))
+        handler.flush()
+
+        mock_client.put_logs.assert_called_once()
+        assert mock_oci.loggingingestion.models.LogEntry.call_count == 50
+
+    def test_full_buffer_drops_oldest_without_blocking(self):
+        """Test that a full buffer never blocks emit and that dropped entries are reported."""
+        handler = OCILogHandler(
+            logging_client=Mock(), log_group_id="ocid1.loggroup.oc1...", log_id="ocid1.log.oc1...", max_buffer_size=2
+        )
+        handler._start_flush_thread = Mock()  # keep delivery on the test thread
+
+        for i in range(5):
+            handler.emit(logging.makeLogRecord({"name": "test", "msg": f"message {i}"}))
+        assert handler._dropped == 3
+
+        with patch.object(handler, "_send_log_entries") as mock_send:
+            handler.flush()
+
+        batch = mock_send.call_args[0][0]
+        assert [entry["data"]["message"] for entry in batch[:2]] == ["message 3", "message 4"]
+        assert batch[2]["data"]["dropped"] == 3
+        assert handler._dropped == 0
+
+    @patch("flask_remote_logging.oci_extension.oci")
+    def test_entry_ids_are_unique_across_handlers(self, mock_oci):
+        """Test that entry IDs combine a per-handler prefix with a running counter."""
+        handlers = [
+            OCILogHandler(logging_client=Mock(), log_group_id="ocid1.loggroup.oc1...", log_id="ocid1.log.oc1...")
+            for _ in range(2)
+        ]
+        entry = {"time": "2023-01-01T00:00:00Z", "data": {"message": "same message"}}
+
+        for handler in handlers:
+            handler._send_log_entries([entry, entry])
+
+        ids = [call.kwargs["id"] for call in mock_oci.loggingingestion.models.LogEntry.call_args_list]
+        assert len(set(ids)) == 4
+        assert ids[0].endswith("-0") and ids[1].endswith("-1")
+
+    def test_handle_filters_and_buffers_without_handler_lock(self):
+        """Test that handle applies filters and emits without acquiring the handler lock."""
+        handler = OCILogHandler(logging_client=Mock(), log_group_id="ocid1.loggroup.oc1...", log_id="ocid1.log.oc1...")
+        handler._start_flush_thread = Mock()
+        handler.addFilter(lambda record: record.msg != "filtered")
+        handler.acquire = Mock()
+
+        assert handler.handle(logging.makeLogRecord({"name": "test", "msg": "kept"}))
+        assert not handler.handle(logging.makeLogRecord({"name": "test", "msg": "filtered"}))
+
+        assert [entry["data"]["message"] for entry in handler._buffer] == ["kept"]
+        handler.acquire.assert_not_called()
+        handler._buffer.clear()
+        handler.close()
+
+    def test_reset_after_fork_restarts_flusher_in_child(self):
+        """Test that a forked worker gets a fresh flusher instead of the parent's dead thread."""
+        from flask_remote_logging.oci_extension import _reset_handler_after_fork
+
+        handler = OCILogHandler(logging_client=Mock(), log_group_id="ocid1.loggroup.oc1...", log_id="ocid1.log.oc1...")
+        handler._start_flush_thread = Mock()
+        handler.emit(logging.makeLogRecord({"name": "test", "msg": "buffered before fork"}))
+        handler._flush_thread = Mock()  # stands in for the parent's thread, which does not exist in a child
+
+        _reset_handler_after_fork(weakref.ref(handler))
+
+        assert handler._flush_thread is None
+        assert not handler._buffer
+        handler.emit(logging.makeLogRecord({"name": "test", "msg": "logged in the worker"}))
+        assert handler._start_flush_thread.call_count == 2
+        handler._buffer.clear()
+        handler.close()
+
+    @patch("flask_remote_logging.oci_extension.oci")
+    def test_background_thread_sends_full_batch(self, mock_oci):
+        """Test that the flush thread sends as soon as a batch is full."""
+        sent = threading.Event()
+        mock_client = Mock()
+        mock_client.put_logs.side_effect = lambda **kwargs: sent.set()
+        handler = OCILogHandler(
+            logging_client=mock_client,
+            log_group_id="ocid1.loggroup.oc1...",
+            log_id="ocid1.log.oc1...",
+            batch_size=2,
+            flush_interval=60,
+        )
+
+        handler.emit(logging.makeLogRecord({"name": "test", "msg": "first"}))
+        handler.emit(logging.makeLogRecord({"name": "test", "msg": "second"}))
+
+        assert sent.wait(timeout=5)
+        handler.close()
+        assert not handler._flush_thread.is_alive()
+        mock_client.put_logs.assert_called_once()
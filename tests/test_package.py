@@ -52,13 +52,36 @@ class TestPackageModule:
         assert OCILog is not None
         assert FlaskRemoteLoggingContextFilter is not None
 
-        # Test aliases work correctly
-        assert Graylog == GraylogExtension
-        assert GCPLog == GCPLogExtension
-        assert AWSLog == AWSLogExtension
-        assert AzureLog == AzureLogExtension
-        assert IBMLog == IBMLogExtension
-        assert OCILog == OCILogExtension
+    @pytest.mark.parametrize(
+        "alias_name,canonical_name",
+        [
+            ("Graylog", "GraylogExtension"),
+            ("GCPLog", "GCPLogExtension"),
+            ("AWSLog", "AWSLogExtension"),
+            ("AzureLog", "AzureLogExtension"),
+            ("IBMLog", "IBMLogExtension"),
+            ("OCILog", "OCILogExtension"),
+        ],
+    )
+    def test_alias_is_canonical(self, alias_name, canonical_name):
+        """Test that each short alias is the same class as its canonical name."""
+        assert getattr(flask_remote_logging, alias_name) is getattr(flask_remote_logging, canonical_name)
+
+    def test_extensions_loaded_lazily(self, monkeypatch):
+        """Test that extension classes are resolved on first attribute access."""
+        from flask_remote_logging.aws_extension import AWSLogExtension
+
+        monkeypatch.delitem(vars(flask_remote_logging), "AWSLog", raising=False)
+        assert "AWSLog" not in vars(flask_remote_logging)
+
+        assert flask_remote_logging.AWSLog is AWSLogExtension
+        assert "AWSLog" in vars(flask_remote_logging)
+        assert "AWSLog" in dir(flask_remote_logging)
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            flask_remote_logging.DoesNotExist
 
     def test_package_docstring(self):
         """Test that package has proper docstring."""